@@ -16,18 +16,25 @@ Usage:
 
 import argparse
 import sys
+import time
+from typing import Iterable
 
 from backend.document_processor import (
     ChatHistory,
     DocumentProcessor,
     OllamaConnectionError,
+    iter_document_files,
 )
 from backend.config import CHAT_MODELS, QUIZ_OPTIONS, DOCS_DIR, DB_PATH
 
 
 def _get_processor(args) -> DocumentProcessor:
     try:
-        return DocumentProcessor(persist_dir=args.db_path)
+        # Only `ingest` has --no-cache; None defers to COSMO_EMBED_CACHE
+        use_embed_cache = False if getattr(args, "no_cache", False) else None
+        return DocumentProcessor(
+            persist_dir=args.db_path, use_embed_cache=use_embed_cache
+        )
     except OllamaConnectionError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -95,30 +102,28 @@ def ingest_command(args) -> int:
             print(f"Error: Directory not found: {args.dir}", file=sys.stderr)
             return 1
 
-        pdf_files = sorted(d.glob("**/*.pdf"))
-        md_files = sorted(
-            list(d.glob("**/*.md")) + list(d.glob("**/*.markdown"))
-        )
+        pdf_files: list = []
+        md_files: list = []
+        for fp in iter_document_files(d):
+            (pdf_files if fp.suffix.lower() == ".pdf" else md_files).append(fp)
+        pdf_files.sort()
+        md_files.sort()
         if not pdf_files and not md_files:
             print(f"No supported files found in {args.dir}", file=sys.stderr)
             return 1
 
         print(f"Found {len(pdf_files)} PDFs and {len(md_files)} markdown files")
 
-        for pdf in pdf_files:
-            try:
-                processor.ingest_pdf(
-                    str(pdf), force=args.force, top_level_only=top_level_only
-                )
-            except Exception as e:
-                print(f"Error processing {pdf.name}: {e}", file=sys.stderr)
-        for md in md_files:
-            try:
-                processor.ingest_markdown(
-                    str(md), force=args.force, top_level_only=top_level_only
-                )
-            except Exception as e:
-                print(f"Error processing {md.name}: {e}", file=sys.stderr)
+        results = processor.ingest_files(
+            pdf_files + md_files,
+            force=args.force,
+            top_level_only=top_level_only,
+            workers=args.workers,
+        )
+        for result in results:
+            if "error" in result:
+                print(f"Error processing {result['file']}: {result['error']}",
+                      file=sys.stderr)
 
     else:
         print("Error: Must specify --path or --dir", file=sys.stderr)
@@ -127,6 +132,34 @@ def ingest_command(args) -> int:
     return 0
 
 
+# Streamed tokens are written in one flush once this many characters are
+# buffered, or as soon as a token arrives more than this long after the
+# previous flush (~60 Hz), instead of one write + flush per token.
+_STREAM_FLUSH_CHARS = 256
+_STREAM_FLUSH_SECONDS = 0.016
+
+
+def _stream_to_stdout(tokens: Iterable[str]) -> None:
+    buf = []
+    buffered = 0
+    last = time.perf_counter()
+    try:
+        for token in tokens:
+            buf.append(token)
+            buffered += len(token)
+            now = time.perf_counter()
+            if buffered >= _STREAM_FLUSH_CHARS or now - last > _STREAM_FLUSH_SECONDS:
+                sys.stdout.write("".join(buf))
+                sys.stdout.flush()
+                buf.clear()
+                buffered = 0
+                last = now
+    finally:
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+
+
 def ask_command(args) -> int:
     processor = _get_processor(args)
     if not args.question:
@@ -137,11 +170,9 @@ def ask_command(args) -> int:
     print("Searching documentation...\n")
 
     try:
-        for token in processor.ask_question(
+        _stream_to_stdout(processor.ask_question(
             args.question, mode=args.mode, n_results=args.results
-        ):
-            sys.stdout.write(token)
-            sys.stdout.flush()
+        ))
         print()
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -278,6 +309,7 @@ def quiz_command(args) -> int:
                 quiz_id=args.quiz_id,
                 sections=sections,
                 limit=limit,
+                concurrency=args.concurrency,
             )
             print(f"\nResults written to: {result_path}")
             return 0
@@ -295,6 +327,7 @@ def quiz_command(args) -> int:
                 grounded=grounded,
                 processor=processor,
                 n_results=args.results,
+                concurrency=args.concurrency,
             )
             print(f"\nResults written to: {result_path}")
             return 0
@@ -362,6 +395,9 @@ def benchmark_command(args) -> int:
                 n_results=args.results,
                 sections=sections,
                 limit=limit,
+                parallel_configs=args.parallel_configs,
+                concurrency=args.concurrency,
+                parallel_quizzes=args.parallel_quizzes,
             )
         else:
             # Single quiz
@@ -376,6 +412,8 @@ def benchmark_command(args) -> int:
                 n_results=args.results,
                 sections=sections,
                 limit=limit,
+                parallel_configs=args.parallel_configs,
+                concurrency=args.concurrency,
             )
 
         print(f"\nBenchmark report: {result_path}")
@@ -400,7 +438,7 @@ def _parse_benchmark_configs(raw: str) -> list | None:
         "qwen-7b:rag,qwen-7b:no-rag"
     """
     from backend.quiz_processor import BenchmarkConfig
-    from backend.config import VALID_MODES
+    from backend.config import VALID_MODES_LIST, VALID_MODES_SET
 
     configs = []
     for token in raw.split(","):
@@ -415,9 +453,9 @@ def _parse_benchmark_configs(raw: str) -> list | None:
         rag_str = parts[1]
         ground_str = parts[2] if len(parts) == 3 else "broad"
 
-        if mode not in VALID_MODES:
+        if mode not in VALID_MODES_SET:
             print(f"Error: invalid mode '{mode}'. "
-                  f"Valid: {', '.join(VALID_MODES)}", file=sys.stderr)
+                  f"Valid: {VALID_MODES_LIST}", file=sys.stderr)
             return None
 
         if rag_str == "rag":
@@ -443,6 +481,10 @@ def _parse_benchmark_configs(raw: str) -> list | None:
     return configs
 
 
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+_INTERACTIVE_MODES = frozenset({"qwen-7b", "qwen-14b", "llama", "mistral"})
+
+
 def interactive_command(args) -> int:
     processor = _get_processor(args)
     history = ChatHistory(max_turns=args.history)
@@ -466,19 +508,20 @@ def interactive_command(args) -> int:
             question = input(f"\n[{mode}] Question: ").strip()
             if not question:
                 continue
-            if question.lower() in ("quit", "exit", "q"):
+            command = question.lower()
+            if command in _QUIT_COMMANDS:
                 print("Goodbye!")
                 break
-            if question.lower() == "stats":
+            if command == "stats":
                 list_command(args)
                 continue
-            if question.lower() == "clear":
+            if command == "clear":
                 history.clear()
                 print("Conversation history cleared.")
                 continue
-            if question.lower().startswith("mode "):
+            if command.startswith("mode "):
                 parts = question.split(maxsplit=1)
-                if len(parts) == 2 and parts[1] in ("qwen-7b", "qwen-14b", "llama", "mistral"):
+                if len(parts) == 2 and parts[1] in _INTERACTIVE_MODES:
                     mode = parts[1]
                     print(f"Switched to {mode} mode")
                 else:
@@ -486,11 +529,9 @@ def interactive_command(args) -> int:
                 continue
 
             print("\nSearching...\n")
-            for token in processor.ask_stream(
+            _stream_to_stdout(processor.ask_stream(
                 question, mode=mode, n_results=args.results, history=history
-            ):
-                sys.stdout.write(token)
-                sys.stdout.flush()
+            ))
             print()
 
         except KeyboardInterrupt:
@@ -505,6 +546,17 @@ def interactive_command(args) -> int:
     return 0
 
 
+_COMMANDS = {
+    "ingest": ingest_command,
+    "ask": ask_command,
+    "list": list_command,
+    "interactive": interactive_command,
+    "quiz": quiz_command,
+    "benchmark": benchmark_command,
+    "convert": convert_command,
+}
+
+
 # ===================================================================
 # Argument parser
 # ===================================================================
@@ -537,6 +589,7 @@ Examples:
   # Benchmark across all deck files in a directory
   python -m backend.cli benchmark --dir decks/ --sections tf,mc
   python -m backend.cli benchmark --dir decks/ --configs "qwen-7b:rag,qwen-14b:rag" --limit 20
+  python -m backend.cli benchmark --dir decks/ --parallel-configs 2
 
   python -m backend.cli interactive
   python -m backend.cli list
@@ -561,6 +614,15 @@ Examples:
         help="Only split on ## headings (keep ### and deeper in section body). "
              "Useful for book-style documents like Effective TypeScript.",
     )
+    ingest_p.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes converting PDFs in parallel with --dir "
+             "(default: COSMO_INGEST_CONCURRENCY)",
+    )
+    ingest_p.add_argument(
+        "--no-cache", action="store_true",
+        help="Re-embed every chunk instead of reusing cached embeddings",
+    )
 
     # ask
     ask_p = subparsers.add_parser("ask", help="Ask a question")
@@ -599,6 +661,9 @@ Examples:
                         help="Comma-separated question types to include: tf,mc,sa")
     quiz_p.add_argument("--limit", "-l", type=int, default=None,
                         help="Max number of questions to run (sampled from filtered set)")
+    quiz_p.add_argument("--concurrency", type=int, default=None,
+                        help="Max questions in flight at once "
+                             "(default: COSMO_QUIZ_CONCURRENCY or 1)")
 
     # benchmark
     bench_p = subparsers.add_parser("benchmark",
@@ -619,6 +684,15 @@ Examples:
     bench_p.add_argument("--configs", default=None,
                          help="Custom configs: 'mode:rag|no-rag:grounded|broad,...' "
                               "(default: all 8 model/rag combos)")
+    bench_p.add_argument("--parallel-configs", type=int, default=1,
+                         help="Run up to N configs at once; configs sharing a "
+                              "model still run back-to-back (default: 1)")
+    bench_p.add_argument("--parallel-quizzes", type=int, default=1,
+                         help="With --dir, benchmark up to N quiz files at once "
+                              "(default: 1)")
+    bench_p.add_argument("--concurrency", type=int, default=None,
+                         help="Max questions in flight per config "
+                              "(default: COSMO_QUIZ_CONCURRENCY or 1)")
 
     # list
     subparsers.add_parser("list", help="List indexed documents")
@@ -631,20 +705,11 @@ Examples:
 
     args = parser.parse_args()
 
-    if not args.command:
+    handler = _COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
         return 1
-
-    commands = {
-        "ingest": ingest_command,
-        "ask": ask_command,
-        "list": list_command,
-        "interactive": interactive_command,
-        "quiz": quiz_command,
-        "benchmark": benchmark_command,
-        "convert": convert_command,
-    }
-    return commands[args.command](args)
+    return handler(args)
 
 
 if __name__ == "__main__":
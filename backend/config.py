@@ -27,6 +27,12 @@ DECK_DIR = Path(os.environ.get("COSMO_DECK_DIR", str(PROJECT_ROOT / "decks")))
 # User study documents
 DOCS_DIR = PROJECT_ROOT / "docs"
 
+# On-disk LLM response cache (quiz/benchmark runs)
+LLM_CACHE_DIR = Path(os.environ.get("COSMO_LLM_CACHE_DIR", str(PROJECT_ROOT / ".cache" / "llm")))
+
+# On-disk chunk embedding cache (ingestion)
+EMBED_CACHE_PATH = Path(os.environ.get("COSMO_EMBED_CACHE_PATH", str(PROJECT_ROOT / ".cache" / "embeddings.sqlite")))
+
 # ---------------------------------------------------------------------------
 # Server
 # ---------------------------------------------------------------------------
@@ -42,7 +48,8 @@ ALLOWED_EXTENSIONS = {".pdf", ".md", ".markdown"}
 
 CHUNK_SIZE = int(os.environ.get("COSMO_CHUNK_SIZE", 1200))
 CHUNK_OVERLAP = int(os.environ.get("COSMO_CHUNK_OVERLAP", 200))
-EMBEDDING_BATCH_SIZE = 50
+EMBED_CONCURRENCY = int(os.environ.get("COSMO_EMBED_CONCURRENCY", 4))   # batch embed requests in flight while ingesting
+EMBEDDING_BATCH_SIZE = int(os.environ.get("COSMO_EMBED_BATCH_SIZE", 50))  # chunks per embed request
 EMBED_MAX_TOKENS = int(os.environ.get("COSMO_EMBED_MAX_TOKENS", 500))  # 512 limit with 12-token safety margin
 # ---------------------------------------------------------------------------
 # LLM models (Ollama)
@@ -54,6 +61,11 @@ EMBED_MAX_TOKENS = int(os.environ.get("COSMO_EMBED_MAX_TOKENS", 500))  # 512 lim
 
 EMBED_MODEL = "nomic-embed-text"
 
+# How long Ollama keeps the embedding model loaded after each request, so
+# back-to-back CLI runs and chat sessions skip the model load without
+# pinning it in memory all day
+EMBED_KEEP_ALIVE = os.environ.get("COSMO_EMBED_KEEP_ALIVE", "30m")
+
 CHAT_MODELS = {
     "gemma2-9b": "gemma2:9b",
     "llama3-3b": "llama3.2:3b",
@@ -65,6 +77,8 @@ CHAT_MODELS = {
 }
 
 VALID_MODES = tuple(CHAT_MODELS.keys())
+VALID_MODES_SET = frozenset(VALID_MODES)      # for membership checks
+VALID_MODES_LIST = ", ".join(VALID_MODES)     # for error messages
 
 # ---------------------------------------------------------------------------
 # Ollama inference options
@@ -174,6 +188,54 @@ QUIZ_NUM_PREDICT = {
     "sa": 512,
 }
 
+# Quiz questions sent to Ollama at once. Ollama queues anything beyond
+# its own OLLAMA_NUM_PARALLEL, so this mostly hides per-request latency.
+# Above 1, benchmark Time/Per-Q become wall-clock under contention rather
+# than per-question latency, so sequential is the default.
+QUIZ_CONCURRENCY = int(os.environ.get("COSMO_QUIZ_CONCURRENCY", 1))
+
+# Short-answer grading calls in flight for one /api/quizzes/evaluate_batch
+# request. Timing doesn't matter there, so overlap calls by default;
+# Ollama queues anything beyond its own OLLAMA_NUM_PARALLEL.
+EVAL_CONCURRENCY = int(os.environ.get("COSMO_EVAL_CONCURRENCY", 4))
+
+# Most items one evaluate_batch request may grade
+EVAL_MAX_BATCH = int(os.environ.get("COSMO_EVAL_MAX_BATCH", 50))
+
+# Process-wide cap on quiz/benchmark LLM calls in flight, however quizzes,
+# configs and per-config concurrency are combined
+LLM_MAX_IN_FLIGHT = int(os.environ.get("COSMO_LLM_MAX_IN_FLIGHT", 4))
+
+# Worker processes that convert PDFs when ingesting a directory
+# (/api/ingest/directory, `cli ingest --dir`). Embedding and Chroma writes
+# stay in the main process. Each worker pays ~1.5 s of imports at start,
+# so the default stays small.
+INGEST_CONCURRENCY = int(
+    os.environ.get("COSMO_INGEST_CONCURRENCY", min(4, os.cpu_count() or 1))
+)
+
+# Reuse cached responses for identical (model, options, prompt) quiz, bench
+# and ask/chat calls.
+# Off by default so a normal run always reflects the current model.
+LLM_CACHE_ENABLED = os.environ.get("COSMO_CACHE", "0") == "1"
+
+# Reuse embeddings for chunks already embedded with the same model and
+# text, e.g. on --force re-ingest or boilerplate shared across documents.
+EMBED_CACHE_ENABLED = os.environ.get("COSMO_EMBED_CACHE", "1") == "1"
+
+# Stream TF/MC quiz answers and stop generation once the verdict is
+# settled (a leading True/False, or a parenthesised letter). Grading is
+# unaffected, but stored responses are cut short and timings no longer
+# measure full generation, so it is opt-in.
+QUIZ_EARLY_STOP = os.environ.get("COSMO_QUIZ_EARLY_STOP", "0") == "1"
+
+# Semantic cache for DocumentProcessor.query(): a question whose embedding
+# is at least this cosine-similar to a cached one reuses its retrieval
+# results. Off by default (size 0): a near-duplicate question gets the
+# earlier question's chunks, which is only worth it for repeated workloads.
+QUERY_CACHE_SIZE = int(os.environ.get("COSMO_QUERY_CACHE_SIZE", 0))
+QUERY_CACHE_THRESHOLD = float(os.environ.get("COSMO_QUERY_CACHE_THRESHOLD", 0.95))
+
 # Evaluation endpoint (SA grading in Apollo)
 EVAL_OPTIONS = {
     "num_ctx": 8192,
@@ -5,27 +5,50 @@ Handles ingestion of PDFs and markdown files into a ChromaDB vector store,
 querying with semantic search, and streaming LLM answers via Ollama.
 """
 
+import copy
 import hashlib
 import logging
+import multiprocessing
+import os
 import re
+import threading
 from collections import deque
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple
+from typing import Dict, Generator, Iterator, List, Optional, Tuple
 
 import chromadb
+import numpy as np
 import ollama
 import pymupdf4llm
 
+from backend import response_cache
 from backend.config import (
+    ALLOWED_EXTENSIONS,
     CHAT_MODELS,
     CHAT_OPTIONS,
     CHUNK_OVERLAP,
     CHUNK_SIZE,
     DB_PATH,
+    EMBED_CACHE_ENABLED,
+    EMBED_CACHE_PATH,
+    EMBED_CONCURRENCY,
+    EMBED_KEEP_ALIVE,
     EMBED_MODEL,
     EMBEDDING_BATCH_SIZE,
+    INGEST_CONCURRENCY,
+    LLM_CACHE_ENABLED,
+    QUERY_CACHE_SIZE,
+    QUERY_CACHE_THRESHOLD,
 )
+from backend.embedding_cache import EmbeddingCache, make_key as make_embed_key
+from backend.markdown_chunking import (
+    _HEADING_PATTERN,
+    ChunkWithMetadata,
+    MarkdownSection,
+    chunk_section as _chunk_section,
+)
+from backend.source_index import SourceIndex, scan_collection
 
 logger = logging.getLogger(__name__)
 
@@ -78,32 +101,8 @@ class ChatHistory:
 # Markdown section parsing
 # ---------------------------------------------------------------------------
 
-
-@dataclass
-class MarkdownSection:
-    """A logical section extracted from a markdown file."""
-
-    heading: str          # e.g. "## Props and State"
-    heading_text: str     # e.g. "Props and State"
-    heading_level: int    # e.g. 2
-    body: str             # The text content under this heading
-    breadcrumb: List[str] # e.g. ["React Basics", "Components", "Props and State"]
-    item_number: Optional[str] = None   # e.g. "23" if heading matches Item pattern
-    item_title: Optional[str] = None    # e.g. "Create Objects All at Once"
-
-    @property
-    def breadcrumb_path(self) -> str:
-        """Slash-separated breadcrumb for metadata storage."""
-        return " > ".join(self.breadcrumb)
-
-
-@dataclass
-class ChunkWithMetadata:
-    """A text chunk with all the metadata needed for ChromaDB storage."""
-
-    text: str
-    metadata: Dict[str, str]
-
+# MarkdownSection, ChunkWithMetadata, the heading regex and the paragraph
+# packer are shared with backend.markdown_chunking.
 
 # Regex for "Item 23: Create Objects All at Once" pattern
 _ITEM_PATTERN = re.compile(r"^Item\s+(\d+):\s+(.+)$")
@@ -131,11 +130,11 @@ def parse_markdown_sections(
     - "Item N: Title" pattern extraction into metadata fields
     """
     lines = content.split("\n")
-    heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$")
 
     # First pass: identify all heading positions
     heading_positions: List[Tuple[int, int, str]] = []  # (line_idx, level, text)
     in_code_block = False
+    match_heading = _HEADING_PATTERN.match
 
     for i, line in enumerate(lines):
         if line.strip().startswith("```"):
@@ -144,7 +143,7 @@ def parse_markdown_sections(
         if in_code_block:
             continue
 
-        match = heading_pattern.match(line)
+        match = match_heading(line)
         if match:
             level = len(match.group(1))
             text = match.group(2).strip()
@@ -223,69 +222,8 @@ def chunk_section(
     max_size: int = CHUNK_SIZE,
     overlap: int = CHUNK_OVERLAP,
 ) -> List[str]:
-    """
-    Chunk a single section's body text, respecting paragraph boundaries.
-    Overlap is applied only within the section (never across headings).
-
-    The heading line is prepended to the FIRST chunk so the embedding
-    captures what section the content belongs to.
-    """
-    body = section.body
-    if not body.strip():
-        return []
-
-    paragraphs = body.split("\n\n")
-    raw_chunks: List[str] = []
-    current = ""
-
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            continue
-
-        if len(current) + len(para) + 2 <= max_size:
-            current += ("" if not current else "\n\n") + para
-        else:
-            if current:
-                raw_chunks.append(current)
-            # Handle paragraphs longer than max_size
-            if len(para) > max_size:
-                words = para.split()
-                temp = ""
-                for word in words:
-                    if len(temp) + len(word) + 1 <= max_size:
-                        temp += ("" if not temp else " ") + word
-                    else:
-                        if temp:
-                            raw_chunks.append(temp)
-                        temp = word
-                current = temp
-            else:
-                current = para
-
-    if current:
-        raw_chunks.append(current)
-
-    if not raw_chunks:
-        return []
-
-    # Apply overlap: prepend tail of previous chunk to current chunk
-    overlapped: List[str] = []
-    for i, chunk in enumerate(raw_chunks):
-        if i == 0:
-            # Prepend the heading to the first chunk for embedding context
-            prefix = section.heading + "\n\n" if section.heading else ""
-            overlapped.append(prefix + chunk)
-        else:
-            prev_text = raw_chunks[i - 1]
-            # Take the last `overlap` characters, snapped to a word boundary
-            tail = prev_text[-overlap:]
-            first_space = tail.find(" ")
-            if first_space != -1:
-                tail = tail[first_space + 1 :]
-            overlapped.append(f"[...] {tail}\n\n{chunk}")
-
-    return overlapped
+    """markdown_chunking.chunk_section with the configured chunk size and overlap."""
+    return _chunk_section(section, max_size=max_size, overlap=overlap)
 
 
 def chunk_markdown_file(
@@ -337,17 +275,95 @@ def chunk_markdown_file(
     return results
 
 
+def iter_document_files(root: Path) -> Iterator[Path]:
+    """
+    Recursively yield every ingestible file (.pdf/.md/.markdown, any case)
+    under root, in a single os.scandir walk.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_document_files(Path(entry.path))
+            elif entry.is_file() and Path(entry.name).suffix.lower() in ALLOWED_EXTENSIONS:
+                yield Path(entry.path)
+
+
+def extract_chunks(
+    path: str,
+    file_hash: str,
+    top_level_only: bool = False,
+) -> List[ChunkWithMetadata]:
+    """
+    Read (or convert, for PDFs) a document and chunk it with metadata.
+
+    Pure CPU work with no Chroma or Ollama access, so it can run in a
+    worker process. PDFs are converted to markdown via pymupdf4llm and go
+    through the same heading-hierarchy chunker as native markdown; their
+    chunks keep the original .pdf filename as source, with doc_type "pdf".
+    Returns an empty list if nothing could be extracted.
+    """
+    filename = Path(path).name
+    is_pdf = Path(path).suffix.lower() == ".pdf"
+
+    if is_pdf:
+        # Convert PDF to markdown -- this is where pymupdf4llm does the
+        # heavy lifting: extracting headings, code blocks, tables, lists
+        print(f"  Converting PDF to markdown...")
+        try:
+            content = pymupdf4llm.to_markdown(path)
+        except Exception as e:
+            print(f"  Error converting PDF to markdown: {e}")
+            return []
+
+        if not content.strip():
+            print(f"  No content extracted from {filename}")
+            return []
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+    chunks_with_meta = chunk_markdown_file(
+        content=content,
+        filename=filename,
+        file_hash=file_hash,
+        max_size=CHUNK_SIZE,
+        overlap=CHUNK_OVERLAP,
+        top_level_only=top_level_only,
+    )
+
+    if is_pdf:
+        # Override doc_type so stats/filtering can distinguish PDFs
+        for c in chunks_with_meta:
+            c.metadata["doc_type"] = "pdf"
+
+    if not chunks_with_meta:
+        if is_pdf:
+            print(f"  No chunks produced from {filename}")
+        else:
+            print(f"  No content extracted from {filename}")
+
+    return chunks_with_meta
+
+
 # ---------------------------------------------------------------------------
 # Document processor
 # ---------------------------------------------------------------------------
 
+# Embedding models already warmed in this process
+_warmed_models: set = set()
+_warmup_lock = threading.Lock()
+
 
 class DocumentProcessor:
     """Process, index, and query technical documentation via RAG."""
 
     EMBEDDING_BATCH_SIZE = EMBEDDING_BATCH_SIZE
 
-    def __init__(self, persist_dir: str | None = None):
+    def __init__(
+        self,
+        persist_dir: str | None = None,
+        use_embed_cache: Optional[bool] = None,
+    ):
         import tiktoken
         self._tokenizer = tiktoken.get_encoding("cl100k_base")
         self._check_ollama_connection()
@@ -356,8 +372,32 @@ class DocumentProcessor:
             name="react_typescript_docs",
             metadata={"hnsw:space": "cosine"},
         )
+        # Per-file chunk counts for get_stats(), kept beside the collection
+        self._sources = SourceIndex(Path(persist_dir or DB_PATH) / "sources.sqlite")
+        # Hashes of indexed files, loaded from the source index on first use
+        self._known_hashes: Optional[set] = None
         self.models = CHAT_MODELS
         self.embed_model = EMBED_MODEL
+        self._warm_embed_model()
+
+        # Chunk embeddings cached on disk by (model, text); None disables it
+        if use_embed_cache is None:
+            use_embed_cache = EMBED_CACHE_ENABLED
+        self._embed_cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(EMBED_CACHE_PATH) if use_embed_cache else None
+        )
+
+        # Semantic query cache: unit-normalised query embeddings (one row per
+        # entry), the retrieval payload for each row, and (n_results,
+        # filter_source) so a hit only matches an equivalent query.
+        self._qcache_cap = QUERY_CACHE_SIZE
+        self._qcache_threshold = QUERY_CACHE_THRESHOLD
+        self._qcache_vecs: Optional[np.ndarray] = None
+        self._qcache_payloads: List[Dict] = []
+        self._qcache_keys: List[Tuple[int, Optional[str]]] = []
+        self._qcache_last_used: List[int] = []
+        self._qcache_clock = 0
+        self._qcache_lock = threading.Lock()
 
     # -- connection check ---------------------------------------------------
 
@@ -372,6 +412,27 @@ class DocumentProcessor:
                 f"  ollama serve\nOriginal error: {e}"
             )
 
+    def _warm_embed_model(self) -> None:
+        """
+        Load the embedding model in the background so the first real embed
+        call (often while a PDF is still converting) doesn't pay for it.
+        Runs once per model per process, however many processors are built.
+        """
+        with _warmup_lock:
+            if self.embed_model in _warmed_models:
+                return
+            _warmed_models.add(self.embed_model)
+
+        def warm() -> None:
+            try:
+                ollama.embed(
+                    model=self.embed_model, input="warmup", keep_alive=EMBED_KEEP_ALIVE
+                )
+            except Exception as e:
+                logger.debug(f"Embedding model warmup failed: {e}")
+
+        threading.Thread(target=warm, name="embed-warmup", daemon=True).start()
+
     # -- PDF to markdown conversion -----------------------------------------
 
     @staticmethod
@@ -389,13 +450,32 @@ class DocumentProcessor:
 
     @staticmethod
     def get_file_hash(filepath: str) -> str:
-        h = hashlib.md5()
+        # MD5 stays: stored chunks are keyed on it, so switching algorithms
+        # would make every indexed file look new.
         with open(filepath, "rb") as f:
-            for block in iter(lambda: f.read(8192), b""):
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "md5").hexdigest()
+            h = hashlib.md5()
+            for block in iter(lambda: f.read(1 << 20), b""):
                 h.update(block)
         return h.hexdigest()
 
+    def _source_rows(self) -> List:
+        """Source index rows, backfilling the index on first use if needed."""
+        if self._sources.needs_backfill:
+            # Database predates the source index: build it once from the
+            # collection metadata
+            self._sources.replace_all(scan_collection(self.collection))
+        return self._sources.rows()
+
     def is_already_indexed(self, file_hash: str) -> bool:
+        # A directory ingest checks every file; answer hits from memory and
+        # only ask Chroma on a miss (another process may have indexed it)
+        if self._known_hashes is None:
+            rows = self._source_rows()
+            self._known_hashes = {row[0] for row in rows if row[3] > 0}
+        if file_hash in self._known_hashes:
+            return True
         try:
             results = self.collection.get(where={"file_hash": file_hash}, limit=1)
             return len(results["ids"]) > 0
@@ -408,6 +488,10 @@ class DocumentProcessor:
             self.collection.delete(where={"file_hash": file_hash})
         except Exception as e:
             logger.warning(f"Error deleting existing chunks: {e}")
+        self._sources.remove(file_hash)
+        self.invalidate_cache()
+        if self._known_hashes is not None:
+            self._known_hashes.discard(file_hash)
 
     # -- embedding ----------------------------------------------------------
     def _generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
@@ -422,8 +506,28 @@ class DocumentProcessor:
             else:
                 truncated.append(text)
 
+        cache = self._embed_cache
+        if cache is None:
+            return self._embed_truncated(truncated)
+
+        # Only cache misses go to Ollama; results are merged back in order
+        keys = [make_embed_key(self.embed_model, t) for t in truncated]
+        cached = cache.get_many(keys)
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+        if misses:
+            fresh = self._embed_truncated([truncated[i] for i in misses])
+            # All-zero vectors are placeholders for failed chunks; don't keep them
+            cache.put_many(
+                (keys[i], vec) for i, vec in zip(misses, fresh) if any(vec)
+            )
+            cached.update(zip((keys[i] for i in misses), fresh))
+        return [cached[key] for key in keys]
+
+    def _embed_truncated(self, truncated: List[str]) -> List[List[float]]:
         try:
-            response = ollama.embed(model=self.embed_model, input=truncated)
+            response = ollama.embed(
+                model=self.embed_model, input=truncated, keep_alive=EMBED_KEEP_ALIVE
+            )
             return response["embeddings"]
         except Exception as e:
             logger.debug(f"Batch embed failed ({e}), falling back to one-at-a-time")
@@ -431,7 +535,9 @@ class DocumentProcessor:
         embeddings = []
         for i, text in enumerate(truncated):
             try:
-                response = ollama.embeddings(model=self.embed_model, prompt=text)
+                response = ollama.embeddings(
+                    model=self.embed_model, prompt=text, keep_alive=EMBED_KEEP_ALIVE
+                )
                 embeddings.append(response["embedding"])
             except Exception as e:
                 # Log the problem chunk and skip it with a zero vector
@@ -445,103 +551,158 @@ class DocumentProcessor:
                     embeddings.append([0.0] * len(embeddings[0]))
                 else:
                     # Need to get dimension from a successful embedding first
-                    dummy = ollama.embeddings(model=self.embed_model, prompt="test")
+                    dummy = ollama.embeddings(
+                        model=self.embed_model, prompt="test", keep_alive=EMBED_KEEP_ALIVE
+                    )
                     dim = len(dummy["embedding"])
                     embeddings.append([0.0] * dim)
         return embeddings
 
     # -- ingestion ----------------------------------------------------------
 
-    def ingest_pdf(self, pdf_path: str, force: bool = False, top_level_only: bool = False) -> int:
+    def prepare_ingest(self, path: str, force: bool = False) -> Optional[str]:
         """
-        Convert PDF to markdown via pymupdf4llm, then process with the
-        heading-hierarchy-aware markdown chunker.
-
-        This gives PDFs the same rich metadata (headings, breadcrumbs,
-        section-aware overlap) that native markdown files get.
+        Hash a document and decide whether it needs (re-)indexing.
 
-        Args:
-            top_level_only: Only split on level-1/2 headings. Useful for
-                book-style PDFs like Effective TypeScript.
+        Returns the file hash to index under, or None if the file is already
+        indexed and force is off. With force, existing chunks are deleted.
         """
-        file_hash = self.get_file_hash(pdf_path)
+        file_hash = self.get_file_hash(path)
 
         if not force and self.is_already_indexed(file_hash):
-            print(f"{Path(pdf_path).name} already indexed (use --force to re-index)")
-            return 0
+            print(f"{Path(path).name} already indexed (use --force to re-index)")
+            return None
 
         if force:
             self._delete_existing_chunks(file_hash)
 
-        print(f"Processing: {Path(pdf_path).name}")
-        filename = Path(pdf_path).name
-
-        # Convert PDF to markdown -- this is where pymupdf4llm does the
-        # heavy lifting: extracting headings, code blocks, tables, lists
-        print(f"  Converting PDF to markdown...")
-        try:
-            md_content = self.pdf_to_markdown(pdf_path)
-        except Exception as e:
-            print(f"  Error converting PDF to markdown: {e}")
-            return 0
-
-        if not md_content.strip():
-            print(f"  No content extracted from {filename}")
-            return 0
-
-        # Use the same heading-hierarchy chunker as native markdown files.
-        # Source metadata still shows the original .pdf filename so you
-        # know where the content came from.
-        chunks_with_meta = chunk_markdown_file(
-            content=md_content,
-            filename=filename,
-            file_hash=file_hash,
-            max_size=CHUNK_SIZE,
-            overlap=CHUNK_OVERLAP,
-            top_level_only=top_level_only,
-        )
+        print(f"Processing: {Path(path).name}")
+        return file_hash
 
-        # Override doc_type so stats/filtering can distinguish PDFs
-        for c in chunks_with_meta:
-            c.metadata["doc_type"] = "pdf"
-
-        if not chunks_with_meta:
-            print(f"  No chunks produced from {filename}")
-            return 0
+    def index_chunks(
+        self,
+        chunks_with_meta: List[ChunkWithMetadata],
+        file_hash: str,
+        filename: str,
+    ) -> int:
+        """
+        Embed chunks in batches and add them to the collection.
 
+        Up to EMBED_CONCURRENCY batch embed requests are in flight at once.
+        Embedded batches are buffered and written to the collection with a
+        single add per file (split only at Chroma's max batch size), so the
+        HNSW insert and SQLite transaction are paid once rather than per batch.
+        """
         # Prepare batch arrays
         all_chunks = [c.text for c in chunks_with_meta]
         all_ids = [f"{file_hash}_{i}" for i in range(len(chunks_with_meta))]
         all_metadatas = [c.metadata for c in chunks_with_meta]
 
-        # Generate embeddings in batches and store
-        indexed = 0
-        for batch_start in range(0, len(all_chunks), self.EMBEDDING_BATCH_SIZE):
-            batch_end = min(batch_start + self.EMBEDDING_BATCH_SIZE, len(all_chunks))
-            batch_texts = all_chunks[batch_start:batch_end]
-            batch_ids = all_ids[batch_start:batch_end]
-            batch_meta = all_metadatas[batch_start:batch_end]
+        batch_starts = iter(range(0, len(all_chunks), self.EMBEDDING_BATCH_SIZE))
+        in_flight = deque()
+        workers = max(1, EMBED_CONCURRENCY)
 
-            try:
-                batch_embeddings = self._generate_embeddings_batch(batch_texts)
-            except Exception as e:
-                print(f"  Error generating embeddings for batch {batch_start}-{batch_end}: {e}")
-                continue
+        get_max_batch_size = getattr(self.client, "get_max_batch_size", None)
+        max_add = get_max_batch_size() if get_max_batch_size else 5000
+        pending_ids: List[str] = []
+        pending_embeddings: List[List[float]] = []
+        pending_texts: List[str] = []
+        pending_meta: List[Dict] = []
 
+        def flush() -> int:
+            if not pending_ids:
+                return 0
             self.collection.add(
-                ids=batch_ids,
-                embeddings=batch_embeddings,
-                documents=batch_texts,
-                metadatas=batch_meta,
+                ids=pending_ids,
+                embeddings=pending_embeddings,
+                documents=pending_texts,
+                metadatas=pending_meta,
+            )
+            count = len(pending_ids)
+            # Keep the source index in step with each write
+            self._sources.add(
+                file_hash,
+                pending_meta[0].get("source", "unknown"),
+                pending_meta[0].get("doc_type", "unknown"),
+                count,
             )
-            indexed += len(batch_ids)
+            pending_ids.clear()
+            pending_embeddings.clear()
+            pending_texts.clear()
+            pending_meta.clear()
+            return count
 
-            if batch_end < len(all_chunks):
-                print(f"  Embedded {batch_end}/{len(all_chunks)} chunks...")
+        # Generate embeddings in batches and store
+        indexed = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+
+            def submit_next() -> None:
+                start = next(batch_starts, None)
+                if start is not None:
+                    texts = all_chunks[start:start + self.EMBEDDING_BATCH_SIZE]
+                    in_flight.append(
+                        (start, pool.submit(self._generate_embeddings_batch, texts))
+                    )
+
+            # Keep a bounded window of requests ahead of the writer
+            for _ in range(workers):
+                submit_next()
+
+            while in_flight:
+                batch_start, future = in_flight.popleft()
+                submit_next()
+
+                batch_end = min(batch_start + self.EMBEDDING_BATCH_SIZE, len(all_chunks))
+                batch_texts = all_chunks[batch_start:batch_end]
+                batch_ids = all_ids[batch_start:batch_end]
+                batch_meta = all_metadatas[batch_start:batch_end]
+
+                try:
+                    batch_embeddings = future.result()
+                except Exception as e:
+                    print(f"  Error generating embeddings for batch {batch_start}-{batch_end}: {e}")
+                    continue
+
+                if len(pending_ids) + len(batch_ids) > max_add:
+                    indexed += flush()
+                pending_ids.extend(batch_ids)
+                pending_embeddings.extend(batch_embeddings)
+                pending_texts.extend(batch_texts)
+                pending_meta.extend(batch_meta)
+
+                if batch_end < len(all_chunks):
+                    print(f"  Embedded {batch_end}/{len(all_chunks)} chunks...")
+
+        indexed += flush()
+        if indexed:
+            self.invalidate_cache()
+            if self._known_hashes is not None:
+                self._known_hashes.add(file_hash)
 
         print(f"Indexed {indexed} chunks from {filename}")
         return indexed
 
+    def ingest_pdf(self, pdf_path: str, force: bool = False, top_level_only: bool = False) -> int:
+        """
+        Convert PDF to markdown via pymupdf4llm, then process with the
+        heading-hierarchy-aware markdown chunker.
+
+        This gives PDFs the same rich metadata (headings, breadcrumbs,
+        section-aware overlap) that native markdown files get.
+
+        Args:
+            top_level_only: Only split on level-1/2 headings. Useful for
+                book-style PDFs like Effective TypeScript.
+        """
+        file_hash = self.prepare_ingest(pdf_path, force)
+        if file_hash is None:
+            return 0
+
+        chunks_with_meta = extract_chunks(pdf_path, file_hash, top_level_only)
+        if not chunks_with_meta:
+            return 0
+        return self.index_chunks(chunks_with_meta, file_hash, Path(pdf_path).name)
+
     def ingest_markdown(self, md_path: str, force: bool = False, top_level_only: bool = False) -> int:
         """
         Process markdown with heading-hierarchy-aware chunking.
@@ -554,66 +715,100 @@ class DocumentProcessor:
             top_level_only: Only split on level-1/2 headings. Useful for
                 book-style markdown where each ## is a chapter or Item.
         """
-        file_hash = self.get_file_hash(md_path)
-
-        if not force and self.is_already_indexed(file_hash):
-            print(f"{Path(md_path).name} already indexed (use --force to re-index)")
+        file_hash = self.prepare_ingest(md_path, force)
+        if file_hash is None:
             return 0
 
-        if force:
-            self._delete_existing_chunks(file_hash)
-
-        print(f"Processing: {Path(md_path).name}")
-        filename = Path(md_path).name
-
-        with open(md_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        chunks_with_meta = chunk_markdown_file(
-            content=content,
-            filename=filename,
-            file_hash=file_hash,
-            max_size=CHUNK_SIZE,
-            overlap=CHUNK_OVERLAP,
-            top_level_only=top_level_only,
-        )
-
+        chunks_with_meta = extract_chunks(md_path, file_hash, top_level_only)
         if not chunks_with_meta:
-            print(f"  No content extracted from {filename}")
             return 0
+        return self.index_chunks(chunks_with_meta, file_hash, Path(md_path).name)
 
-        # Prepare batch arrays
-        all_chunks = [c.text for c in chunks_with_meta]
-        all_ids = [f"{file_hash}_{i}" for i in range(len(chunks_with_meta))]
-        all_metadatas = [c.metadata for c in chunks_with_meta]
+    def ingest_files(
+        self,
+        paths: List[Path],
+        force: bool = False,
+        top_level_only: bool = False,
+        workers: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Ingest several PDF/markdown files, converting them in parallel.
 
-        # Generate embeddings in batches and store
-        indexed = 0
-        for batch_start in range(0, len(all_chunks), self.EMBEDDING_BATCH_SIZE):
-            batch_end = min(batch_start + self.EMBEDDING_BATCH_SIZE, len(all_chunks))
-            batch_texts = all_chunks[batch_start:batch_end]
-            batch_ids = all_ids[batch_start:batch_end]
-            batch_meta = all_metadatas[batch_start:batch_end]
+        Hash/dedup checks and all embedding and Chroma writes happen in this
+        process. When two or more PDFs need indexing they are converted and
+        chunked in a pool of `workers` processes (default INGEST_CONCURRENCY;
+        1 runs everything in-process); markdown is always chunked here. Returns one {"file", "chunks"} or
+        {"file", "error"} dict per path, in input order.
+        """
+        if workers is None:
+            workers = INGEST_CONCURRENCY
 
+        results: Dict[Path, Dict] = {}
+        pending: Dict[str, Path] = {}  # file hash -> path
+        for filepath in paths:
             try:
-                batch_embeddings = self._generate_embeddings_batch(batch_texts)
+                file_hash = self.prepare_ingest(str(filepath), force=force)
             except Exception as e:
-                print(f"  Error generating embeddings for batch {batch_start}-{batch_end}: {e}")
+                results[filepath] = {"file": filepath.name, "error": str(e)}
                 continue
+            if file_hash is None or file_hash in pending:
+                # Already indexed, or a duplicate of a file queued above
+                results[filepath] = {"file": filepath.name, "chunks": 0}
+            else:
+                pending[file_hash] = filepath
 
-            self.collection.add(
-                ids=batch_ids,
-                embeddings=batch_embeddings,
-                documents=batch_texts,
-                metadatas=batch_meta,
-            )
-            indexed += len(batch_ids)
-
-            if batch_end < len(all_chunks):
-                print(f"  Embedded {batch_end}/{len(all_chunks)} chunks...")
-
-        print(f"Indexed {indexed} chunks from {filename}")
-        return indexed
+        def index(file_hash: str, extract) -> None:
+            filepath = pending[file_hash]
+            try:
+                chunks = extract()
+                count = (
+                    self.index_chunks(chunks, file_hash, filepath.name)
+                    if chunks else 0
+                )
+                results[filepath] = {"file": filepath.name, "chunks": count}
+            except Exception as e:
+                results[filepath] = {"file": filepath.name, "error": str(e)}
+
+        # Only PDF conversion is worth a worker process: each spawned worker
+        # re-imports this module (chromadb, ollama, pymupdf4llm), while
+        # chunking a markdown file takes milliseconds.
+        pdfs = [h for h, fp in pending.items() if fp.suffix.lower() == ".pdf"]
+        if workers <= 1 or len(pdfs) <= 1:
+            pdfs = []
+        local = [h for h in pending if h not in pdfs]
+
+        def index_local() -> None:
+            for file_hash in local:
+                filepath = pending[file_hash]
+                index(file_hash, lambda: extract_chunks(
+                    str(filepath), file_hash, top_level_only
+                ))
+
+        if not pdfs:
+            index_local()
+        else:
+            # Conversion and chunking are CPU-bound; embedding and writes
+            # stay in this process so they share the one Chroma client.
+            # Spawn, not fork: the caller may be a multithreaded server
+            # (Flask, Chroma and warm-up threads), and a forked child can
+            # deadlock on a lock that was held at fork time.
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(pdfs)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        extract_chunks, str(pending[file_hash]), file_hash,
+                        top_level_only,
+                    ): file_hash
+                    for file_hash in pdfs
+                }
+                # Markdown is indexed here while the workers convert PDFs
+                index_local()
+                for future in as_completed(futures):
+                    index(futures[future], future.result)
+
+        return [results[fp] for fp in paths]
 
     # -- querying -----------------------------------------------------------
 
@@ -623,22 +818,172 @@ class DocumentProcessor:
         n_results: int = 5,
         filter_source: Optional[str] = None,
     ) -> Dict:
-        """Query the vector database for relevant chunks."""
-        where_clause = None
-        if filter_source:
-            where_clause = {"source": filter_source}
+        """
+        Query the vector database for relevant chunks.
 
+        Paraphrases of a recent question (embedding cosine similarity at or
+        above QUERY_CACHE_THRESHOLD) reuse that question's results instead
+        of searching Chroma again. Each caller gets its own copy.
+        """
         query_embedding = ollama.embeddings(
-            model=self.embed_model, prompt=question
+            model=self.embed_model, prompt=question, keep_alive=EMBED_KEEP_ALIVE
         )["embedding"]
 
+        if self._qcache_cap <= 0:
+            return self.query_by_vector(query_embedding, n_results, filter_source)
+
+        vec = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec /= norm
+        key = (n_results, filter_source)
+
+        cached = self._qcache_lookup(vec, key)
+        if cached is not None:
+            return cached
+
+        results = self.query_by_vector(query_embedding, n_results, filter_source)
+        self._qcache_store(vec, key, results)
+        return results
+
+    def _qcache_lookup(
+        self, vec: np.ndarray, key: Tuple[int, Optional[str]]
+    ) -> Optional[Dict]:
+        with self._qcache_lock:
+            count = len(self._qcache_payloads)
+            if not count or self._qcache_vecs.shape[1] != vec.shape[0]:
+                return None
+
+            sims = self._qcache_vecs[:count] @ vec
+            for i, entry_key in enumerate(self._qcache_keys):
+                if entry_key != key:
+                    sims[i] = -1.0
+
+            best = int(sims.argmax())
+            if sims[best] < self._qcache_threshold:
+                return None
+
+            self._qcache_clock += 1
+            self._qcache_last_used[best] = self._qcache_clock
+            return copy.deepcopy(self._qcache_payloads[best])
+
+    def _qcache_store(
+        self, vec: np.ndarray, key: Tuple[int, Optional[str]], results: Dict
+    ) -> None:
+        # Keep a private copy so the caller can't mutate the cached entry
+        results = copy.deepcopy(results)
+        with self._qcache_lock:
+            if self._qcache_vecs is None or self._qcache_vecs.shape[1] != vec.shape[0]:
+                # First entry (or the embedding model changed size)
+                self._qcache_vecs = np.empty(
+                    (self._qcache_cap, vec.shape[0]), dtype=np.float32
+                )
+                self._qcache_payloads.clear()
+                self._qcache_keys.clear()
+                self._qcache_last_used.clear()
+
+            self._qcache_clock += 1
+            if len(self._qcache_payloads) < self._qcache_cap:
+                slot = len(self._qcache_payloads)
+                self._qcache_payloads.append(results)
+                self._qcache_keys.append(key)
+                self._qcache_last_used.append(self._qcache_clock)
+            else:
+                # Full: overwrite the least recently used entry
+                slot = min(
+                    range(self._qcache_cap), key=self._qcache_last_used.__getitem__
+                )
+                self._qcache_payloads[slot] = results
+                self._qcache_keys[slot] = key
+                self._qcache_last_used[slot] = self._qcache_clock
+            self._qcache_vecs[slot] = vec
+
+    def invalidate_cache(self) -> None:
+        """Drop cached query results, e.g. after new documents are ingested."""
+        with self._qcache_lock:
+            self._qcache_vecs = None
+            self._qcache_payloads.clear()
+            self._qcache_keys.clear()
+            self._qcache_last_used.clear()
+
+    def query_by_vector(
+        self,
+        embedding: List[float],
+        n_results: int = 5,
+        filter_source: Optional[str] = None,
+    ) -> Dict:
+        """Query the vector database with an already-computed query embedding."""
+        where_clause = None
+        if filter_source:
+            where_clause = {"source": filter_source}
+
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=[embedding],
             n_results=n_results,
             where=where_clause,
         )
         return results
 
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several query texts in one Ollama request.
+
+        Falls back to one request per text if the batched call fails.
+        """
+        if not texts:
+            return []
+
+        try:
+            return ollama.embed(
+                model=self.embed_model, input=texts, keep_alive=EMBED_KEEP_ALIVE
+            )["embeddings"]
+        except Exception as e:
+            logger.debug(f"Batch embed failed ({e}), embedding one-at-a-time")
+
+        return [
+            ollama.embeddings(
+                model=self.embed_model, prompt=text, keep_alive=EMBED_KEEP_ALIVE
+            )["embedding"]
+            for text in texts
+        ]
+
+    def query_batch(
+        self,
+        questions: List[str],
+        n_results: int = 5,
+        filter_source: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Query the vector database for several questions at once.
+
+        All questions are embedded in one request and searched in one
+        collection query. Returns one result dict per question, shaped like
+        the return value of query().
+        """
+        if not questions:
+            return []
+
+        embeddings = self.embed_texts(questions)
+
+        where_clause = None
+        if filter_source:
+            where_clause = {"source": filter_source}
+
+        results = self.collection.query(
+            query_embeddings=embeddings,
+            n_results=n_results,
+            where=where_clause,
+        )
+        # Chroma returns one column per query; split them back out so each
+        # entry looks like a single-question query() result.
+        return [
+            {
+                key: value if value is None or key == "included" else [value[i]]
+                for key, value in results.items()
+            }
+            for i in range(len(questions))
+        ]
+
     def _build_rag_prompt(
         self,
         question: str,
@@ -736,6 +1081,8 @@ class DocumentProcessor:
         n_results: int = 5,
         history: Optional[ChatHistory] = None,
         grounded: bool = True,
+        use_cache: Optional[bool] = None,
+        results: Optional[Dict] = None,
     ) -> Generator[str, None, str]:
         """
         Answer a question using RAG with streaming.
@@ -746,8 +1093,15 @@ class DocumentProcessor:
             grounded: If True (default), answers strictly from docs.
                 If False, supplements with LLM knowledge when docs
                 are insufficient. Use grounded=False for quizzes.
+            use_cache: Replay a cached answer for an identical (model,
+                options, prompt) instead of generating one; the prompt
+                includes the retrieved context and history. Defaults to
+                LLM_CACHE_ENABLED.
+            results: Retrieval results already fetched for this question
+                (shaped like query()'s return value); skips the search.
         """
-        results = self.query(question, n_results=n_results)
+        if results is None:
+            results = self.query(question, n_results=n_results)
 
         if not results["documents"][0]:
             if grounded:
@@ -769,7 +1123,20 @@ class DocumentProcessor:
         if history and len(history) > 0 and options["num_ctx"] < 8192:
             options["num_ctx"] = 8192
 
-        full_answer = ""
+        if use_cache is None:
+            use_cache = LLM_CACHE_ENABLED
+        cache_key = None
+        if use_cache:
+            cache_key = response_cache.make_key(model, options, prompt)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                if history is not None:
+                    history.add(question, cached)
+                yield sources
+                return cached + sources
+
+        answer_parts: List[str] = []
 
         try:
             stream = ollama.chat(
@@ -781,7 +1148,7 @@ class DocumentProcessor:
 
             for chunk in stream:
                 token = chunk["message"]["content"]
-                full_answer += token
+                answer_parts.append(token)
                 yield token
 
         except Exception as e:
@@ -792,6 +1159,9 @@ class DocumentProcessor:
             yield error_msg
             return error_msg
 
+        full_answer = "".join(answer_parts)
+        if cache_key is not None:
+            response_cache.put(cache_key, full_answer)
         if history is not None:
             history.add(question, full_answer)
 
@@ -809,13 +1179,12 @@ class DocumentProcessor:
         if count == 0:
             return {"total_chunks": 0, "total_documents": 0, "sources": {}}
 
-        all_data = self.collection.get(include=["metadatas"])
+        rows = self._source_rows()
         sources: Dict[str, Dict] = {}
-        for meta in all_data["metadatas"]:
-            src = meta.get("source", "unknown")
+        for _, src, doc_type, chunks in rows:
             if src not in sources:
-                sources[src] = {"type": meta.get("doc_type", "unknown"), "chunks": 0}
-            sources[src]["chunks"] += 1
+                sources[src] = {"type": doc_type, "chunks": 0}
+            sources[src]["chunks"] += chunks
 
         return {
             "total_chunks": count,
@@ -0,0 +1,92 @@
+"""
+Embedding cache — content-addressed SQLite store for chunk embeddings.
+
+Forced re-ingests and documents that share boilerplate (licences, tables
+of contents) send identical chunks to the embedding model; a cache hit
+skips the Ollama round-trip. Entries are keyed on (model, chunk text) and
+stored as float32 blobs, the precision Chroma keeps the vectors in anyway.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(model: str, text: str) -> str:
+    """Hash the embedding model and the exact text it embeds."""
+    return hashlib.blake2b(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Thread-safe key -> embedding store backed by one SQLite file.
+
+    Read and write errors are logged and treated as misses so a broken
+    cache never fails an ingest.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            # float32 rows; the table name changed with the dtype so blobs
+            # written as float64 by older versions are never misread
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_f32 "
+                "(key TEXT PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings for whichever keys are present."""
+        if not keys:
+            return {}
+        found: Dict[str, List[float]] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                # Stay well under SQLite's bound-parameter limit
+                for i in range(0, len(keys), 500):
+                    part = keys[i:i + 500]
+                    rows = conn.execute(
+                        "SELECT key, vec FROM embeddings_f32 WHERE key IN "
+                        f"({','.join('?' * len(part))})",
+                        part,
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading embedding cache {self.path}: {e}")
+            return {}
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, List[float]]]) -> None:
+        """Store (key, embedding) pairs, replacing any existing entries."""
+        rows = [
+            (key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items
+        ]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings_f32 (key, vec) VALUES (?, ?)", rows
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing embedding cache {self.path}: {e}")
@@ -0,0 +1,49 @@
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson parses large deck files and serializes result dumps several times
+faster than the stdlib module and works on the same plain dict/list
+structures, so callers don't need to care which backend is active.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency — stdlib json is the fallback
+    orjson = None
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """Parse a JSON document from a string or bytes."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(path: Union[str, Path], data: Any) -> None:
+    """Write data to a file as indented UTF-8 JSON."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
@@ -28,6 +28,8 @@ class MarkdownSection:
     heading_level: int               # e.g. 2
     body: str                        # The text content under this heading
     breadcrumb: List[str]            # e.g. ["React Basics", "Components", "Props and State"]
+    item_number: Optional[str] = None   # e.g. "23" if heading matches Item pattern
+    item_title: Optional[str] = None    # e.g. "Create Objects All at Once"
 
     @property
     def breadcrumb_path(self) -> str:
@@ -48,6 +50,8 @@ class ChunkWithMetadata:
 # Section parser
 # ---------------------------------------------------------------------------
 
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+
 def parse_markdown_sections(content: str) -> List[MarkdownSection]:
     """
     Parse markdown into sections split by headings, preserving hierarchy.
@@ -62,11 +66,11 @@ def parse_markdown_sections(content: str) -> List[MarkdownSection]:
     - Headings inside fenced code blocks (they'll be mis-detected; rare in docs)
     """
     lines = content.split("\n")
-    heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$")
 
     # First pass: identify all heading positions
     heading_positions: List[Tuple[int, int, str]] = []  # (line_idx, level, text)
     in_code_block = False
+    match_heading = _HEADING_PATTERN.match
 
     for i, line in enumerate(lines):
         # Track fenced code blocks to skip headings inside them
@@ -76,7 +80,7 @@ def parse_markdown_sections(content: str) -> List[MarkdownSection]:
         if in_code_block:
             continue
 
-        match = heading_pattern.match(line)
+        match = match_heading(line)
         if match:
             level = len(match.group(1))
             text = match.group(2).strip()
@@ -154,36 +158,50 @@ def chunk_section(
         return []
 
     paragraphs = body.split("\n\n")
+
+    if len(body) <= max_size:
+        # Fits in one chunk (stripping only shortens it): skip packing and overlap
+        prefix = section.heading + "\n\n" if section.heading else ""
+        return [prefix + "\n\n".join(p for p in map(str.strip, paragraphs) if p)]
     raw_chunks: List[str] = []
-    current = ""
+    # Pieces of the chunk being built, joined once when it is flushed;
+    # current_len tracks the joined length.
+    current: List[str] = []
+    current_len = 0
 
     for para in paragraphs:
         para = para.strip()
         if not para:
             continue
 
-        if len(current) + len(para) + 2 <= max_size:
-            current += ("" if not current else "\n\n") + para
+        if current_len + len(para) + 2 <= max_size:
+            current_len += len(para) + (2 if current else 0)
+            current.append(para)
         else:
             if current:
-                raw_chunks.append(current)
+                raw_chunks.append("\n\n".join(current))
             # Handle paragraphs longer than max_size
             if len(para) > max_size:
                 words = para.split()
-                temp = ""
+                temp: List[str] = []
+                temp_len = 0
                 for word in words:
-                    if len(temp) + len(word) + 1 <= max_size:
-                        temp += ("" if not temp else " ") + word
+                    if temp_len + len(word) + 1 <= max_size:
+                        temp_len += len(word) + (1 if temp else 0)
+                        temp.append(word)
                     else:
                         if temp:
-                            raw_chunks.append(temp)
-                        temp = word
-                current = temp
+                            raw_chunks.append(" ".join(temp))
+                        temp = [word]
+                        temp_len = len(word)
+                current = [" ".join(temp)]
+                current_len = temp_len
             else:
-                current = para
+                current = [para]
+                current_len = len(para)
 
     if current:
-        raw_chunks.append(current)
+        raw_chunks.append("\n\n".join(current))
 
     if not raw_chunks:
         return []
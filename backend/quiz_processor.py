@@ -10,23 +10,48 @@ Handles:
 - Benchmarking across configurations (mode, RAG, grounded)
 """
 
-import json
+import io
 import logging
 import random
 import re
+import string
+import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from backend import response_cache
+from backend.config import (
+    CHAT_MODELS,
+    LLM_CACHE_ENABLED,
+    LLM_MAX_IN_FLIGHT,
+    QUIZ_CONCURRENCY,
+    QUIZ_EARLY_STOP,
+    QUIZ_NUM_PREDICT,
+    QUIZ_OPTIONS,
+)
+from backend.json_io import read_json, write_json
+
+try:
+    import ollama as _ollama
+except ImportError:  # parsing and grading still work without the client
+    _ollama = None
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cap on quiz LLM calls: parallel quizzes x parallel configs x
+# per-config concurrency would otherwise multiply without bound.
+_llm_slots = threading.BoundedSemaphore(max(1, LLM_MAX_IN_FLIGHT))
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     id: str
     qtype: str  # "tf", "sa", or "mc"
@@ -35,14 +60,14 @@ class Question:
     code: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerKeyEntry:
     id: str
     answer: str
     explanation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GradedQuestion:
     question: Question
     llm_answer: str
@@ -53,7 +78,7 @@ class GradedQuestion:
     score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Results from a single benchmark run."""
     label: str
@@ -68,6 +93,15 @@ class BenchmarkResult:
     elapsed: float   # seconds
     graded: List[GradedQuestion]
 
+    @property
+    def gradable(self) -> int:
+        return self.total - self.ungraded
+
+    @property
+    def per_q(self) -> float:
+        """Average seconds per question."""
+        return self.elapsed / self.total if self.total > 0 else 0
+
 
 # ---------------------------------------------------------------------------
 # Quiz parser — markdown
@@ -76,59 +110,64 @@ class BenchmarkResult:
 class QuizParser:
     """Parse a quiz markdown file into questions and answer key."""
 
-    _QUESTION_ID_RE = re.compile(
-        r"^\*\*(?P<id>(?:TF|SA|MC)-\d+)\.\*\*\s*", re.MULTILINE
-    )
-    _CHOICE_RE = re.compile(r"^\(([a-d])\)\s+(.+)$", re.MULTILINE)
-    _TABLE_ROW_RE = re.compile(
-        r"^\|\s*(?P<id>(?:TF|SA|MC)-\d+)\s*\|\s*"
+    # Question headings ("**TF-1.**") and answer-key table rows
+    # ("| TF-1 | **T** | ... |") in one alternation, so the file is
+    # scanned once and each match is routed by which group fired.
+    _ITEM_RE = re.compile(
+        r"^\*\*(?P<qid>(?P<kind>TF|SA|MC)-\d+)\.\*\*\s*"
+        r"|^\|\s*(?P<row_id>(?:TF|SA|MC)-\d+)\s*\|\s*"
         r"\*?\*?\(?(?P<answer>[TFabcd])\)?\*?\*?\s*\|\s*"
         r"(?P<explanation>.*?)\s*\|$",
         re.MULTILINE,
     )
+    _CHOICE_RE = re.compile(r"^\(([a-d])\)\s+(.+)$", re.MULTILINE)
+    _QTYPES = {"TF": "tf", "MC": "mc", "SA": "sa"}
 
     def parse(self, content: str) -> Tuple[List[Question], List[AnswerKeyEntry]]:
-        questions = self._parse_questions(content)
-        answer_key = self._parse_answer_key(content)
-        return questions, answer_key
-
-    def _parse_questions(self, content: str) -> List[Question]:
         questions: List[Question] = []
-        matches = list(self._QUESTION_ID_RE.finditer(content))
-
-        for i, match in enumerate(matches):
-            qid = match.group("id")
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-            body = content[start:end].strip()
-
-            if qid.startswith("TF"):
-                qtype = "tf"
-            elif qid.startswith("MC"):
-                qtype = "mc"
-            else:
-                qtype = "sa"
+        answer_key: List[AnswerKeyEntry] = []
+
+        # A question's body runs until the next question heading
+        open_qid: Optional[str] = None
+        open_qtype = ""
+        body_start = 0
+
+        for m in self._ITEM_RE.finditer(content):
+            qid = m.group("qid")
+            if qid is None:
+                answer_key.append(
+                    AnswerKeyEntry(
+                        id=m.group("row_id"),
+                        answer=m.group("answer").strip(),
+                        explanation=m.group("explanation").strip(),
+                    )
+                )
+                continue
 
-            choices: List[str] = []
-            if qtype == "mc":
-                for cm in self._CHOICE_RE.finditer(body):
-                    choices.append(f"({cm.group(1)}) {cm.group(2)}")
+            if open_qid is not None:
+                questions.append(self._build_question(
+                    open_qid, open_qtype, content[body_start:m.start()]
+                ))
+            open_qid = qid
+            open_qtype = self._QTYPES[m.group("kind")]
+            body_start = m.end()
 
-            questions.append(Question(id=qid, qtype=qtype, text=body, choices=choices))
+        if open_qid is not None:
+            questions.append(
+                self._build_question(open_qid, open_qtype, content[body_start:])
+            )
 
-        return questions
+        return questions, answer_key
 
-    def _parse_answer_key(self, content: str) -> List[AnswerKeyEntry]:
-        entries: List[AnswerKeyEntry] = []
-        for m in self._TABLE_ROW_RE.finditer(content):
-            entries.append(
-                AnswerKeyEntry(
-                    id=m.group("id"),
-                    answer=m.group("answer").strip(),
-                    explanation=m.group("explanation").strip(),
-                )
-            )
-        return entries
+    def _build_question(self, qid: str, qtype: str, body: str) -> Question:
+        body = body.strip()
+
+        choices: List[str] = []
+        if qtype == "mc":
+            for cm in self._CHOICE_RE.finditer(body):
+                choices.append(f"({cm.group(1)}) {cm.group(2)}")
+
+        return Question(id=qid, qtype=qtype, text=body, choices=choices)
 
 
 # ---------------------------------------------------------------------------
@@ -178,10 +217,10 @@ def parse_json_quiz(
     questions: List[Question] = []
     answer_key: Dict[str, AnswerKeyEntry] = {}
 
-    for section in quiz.get("sections", []):
+    for section in quiz.get("sections", ()):
         sec_type = section.get("type", "")
 
-        for q in section.get("questions", []):
+        for q in section.get("questions", ()):
             qid = q.get("id", "")
 
             if sec_type == "true_false":
@@ -197,7 +236,7 @@ def parse_json_quiz(
                 )
 
             elif sec_type == "multiple_choice":
-                options = q.get("options", [])
+                options = q.get("options", ())
                 choices = [
                     f"({chr(ord('a') + i)}) {opt}"
                     for i, opt in enumerate(options)
@@ -239,13 +278,12 @@ def parse_json_quiz(
 
 def list_json_quizzes(path: str) -> List[dict]:
     """List all quizzes available in a JSON file."""
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(path)
     results = []
     for quiz in data.get("quizzes", []):
         total = sum(
-            len(s.get("questions", []))
-            for s in quiz.get("sections", [])
+            len(s.get("questions", ()))
+            for s in quiz.get("sections", ())
         )
         results.append({
             "id": quiz.get("id", "?"),
@@ -304,9 +342,8 @@ def filter_questions(
     if limit is not None and limit < len(filtered):
         filtered = filtered[:limit]
 
-    # Prune answer key to match
-    filtered_ids = {q.id for q in filtered}
-    pruned_key = {k: v for k, v in answer_key.items() if k in filtered_ids}
+    # Prune answer key to match (question ids are unique)
+    pruned_key = {q.id: answer_key[q.id] for q in filtered if q.id in answer_key}
 
     return filtered, pruned_key
 
@@ -315,13 +352,44 @@ def filter_questions(
 # Answer extraction
 # ---------------------------------------------------------------------------
 
+# Compiled once — extract_answer runs for every question of every benchmark config
+# Leading noise skipped before a TF verdict: markdown markers plus every
+# character str.isspace() (and so regex \s) accepts
+_TF_LEAD_CHARS = (
+    "*#>-" + string.whitespace + "\x1c\x1d\x1e\x1f\x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+_TF_VERDICT_RE = re.compile(
+    r"\b(?:answer|statement|claim|assertion|this)\s+is\s+(true|false)\b"
+)
+_TF_WORD_RE = re.compile(r"\b(true|false)\b")
+_TF_BOLD_RE = re.compile(r"\*\*(true|false)\*\*")
+_TF_COLON_RE = re.compile(r":\s*(true|false)\b")
+_TF_ANY_RE = re.compile(r"\b(?:the\s+)?(?:correct\s+)?answer\s+is\s+(true|false)\b")
+
+_MC_PAREN_RE = re.compile(r"\(([a-d])\)")
+# MC passes 2-4 as one pattern, in priority order. Each branch sits inside
+# a lookahead so a lower-priority match never consumes text that a
+# higher-priority branch needs; the group name says which pass matched.
+_MC_MARKER_RE = re.compile(
+    r"(?="
+    r"\b(?:the\s+)?(?:correct\s+)?answer\s+is\s+\(?(?P<verdict>[a-d])\)?\b"
+    r"|\*\*\(?(?P<bold>[a-d])\)?\*\*"
+    r"|(?:^|\n)\s*(?P<line>[a-d])[.:)\s]"
+    r")"
+)
+_MC_MARKER_RANK = {"verdict": 0, "bold": 1, "line": 2}
+_MC_ANY_LETTER_RE = re.compile(r"[a-dA-D]")
+
+
 def extract_answer(llm_response: str, qtype: str) -> str:
     """
     Extract a normalized answer from an LLM response.
 
     For TF: returns "T" or "F".
     For MC: returns a letter "a"-"d".
-    For SA: returns the full response.
+    For SA: returns the full response, stripped.
 
     Uses a multi-pass strategy:
       1. Check if response starts with the answer
@@ -333,6 +401,10 @@ def extract_answer(llm_response: str, qtype: str) -> str:
     if not cleaned:
         return "?"
 
+    if qtype == "sa":
+        # Stripped: write_results embeds it inline in the markdown report
+        return cleaned
+
     if qtype == "tf":
         return _extract_tf(cleaned)
 
@@ -347,53 +419,55 @@ def _extract_tf(response: str) -> str:
     lower = response.lower()
 
     # Pass 1: starts with True/False (possibly after whitespace or **)
-    stripped_start = re.sub(r"^[\s*#>\-]+", "", lower)
+    stripped_start = lower.lstrip(_TF_LEAD_CHARS)
     if stripped_start.startswith("true"):
         return "T"
     if stripped_start.startswith("false"):
         return "F"
 
     # Pass 2: first line contains a clear verdict
-    first_line = lower.split("\n")[0]
+    first_line = lower.split("\n", 1)[0]
     # Patterns like "the answer is true", "this is false", "the statement is true"
-    verdict_match = re.search(
-        r"\b(?:answer|statement|claim|assertion|this)\s+is\s+(true|false)\b",
-        first_line,
-    )
+    verdict_match = _TF_VERDICT_RE.search(first_line)
     if verdict_match:
         return "T" if verdict_match.group(1) == "true" else "F"
 
     # "True." or "False." or "True," or "True:" standalone-ish in first line
-    tf_word = re.search(r"\b(true|false)\b", first_line)
+    tf_word = _TF_WORD_RE.search(first_line)
     if tf_word:
         return "T" if tf_word.group(1) == "true" else "F"
 
     # Pass 3: scan first 3 lines for "**True**", "**False**", ": True", etc.
-    first_lines = "\n".join(lower.split("\n")[:3])
+    first_lines = "\n".join(lower.split("\n", 3)[:3])
 
-    bold_match = re.search(r"\*\*(true|false)\*\*", first_lines)
+    bold_match = _TF_BOLD_RE.search(first_lines)
     if bold_match:
         return "T" if bold_match.group(1) == "true" else "F"
 
-    colon_match = re.search(r":\s*(true|false)\b", first_lines)
+    colon_match = _TF_COLON_RE.search(first_lines)
     if colon_match:
         return "T" if colon_match.group(1) == "true" else "F"
 
     # Pass 4: anywhere in response, look for definitive verdict patterns
-    verdict_anywhere = re.search(
-        r"\b(?:the\s+)?(?:correct\s+)?answer\s+is\s+(true|false)\b", lower
-    )
+    verdict_anywhere = _TF_ANY_RE.search(lower)
     if verdict_anywhere:
         return "T" if verdict_anywhere.group(1) == "true" else "F"
 
     # Pass 5: count occurrences — if the response says "true" or "false"
-    # exactly once (outside of quoting the question), that's likely the answer
-    true_count = len(re.findall(r"\btrue\b", lower))
-    false_count = len(re.findall(r"\bfalse\b", lower))
-
-    if true_count > 0 and false_count == 0:
+    # exactly once (outside of quoting the question), that's likely the answer.
+    # One scan tallies both words and stops as soon as both have appeared.
+    saw_true = saw_false = False
+    for word in _TF_WORD_RE.finditer(lower):
+        if word.group(1) == "true":
+            saw_true = True
+        else:
+            saw_false = True
+        if saw_true and saw_false:
+            return "?"
+
+    if saw_true:
         return "T"
-    if false_count > 0 and true_count == 0:
+    if saw_false:
         return "F"
 
     return "?"
@@ -405,31 +479,29 @@ def _extract_mc(response: str) -> str:
     lower = cleaned.lower()
 
     # Pass 1: parenthesized letter like (a), (b), etc.
-    m = re.search(r"\(([a-d])\)", cleaned)
+    m = _MC_PAREN_RE.search(cleaned)
     if m:
         return m.group(1)
 
-    # Pass 2: "answer is (a)" or "answer is a" patterns
-    verdict = re.search(
-        r"\b(?:the\s+)?(?:correct\s+)?answer\s+is\s+\(?([a-d])\)?\b", lower
-    )
-    if verdict:
-        return verdict.group(1)
-
-    # Pass 3: bold letter like **a**, **b**
-    bold = re.search(r"\*\*\(?([a-d])\)?\*\*", lower)
-    if bold:
-        return bold.group(1)
-
-    # Pass 4: letter followed by period/colon at start of line — "a. " or "a: "
-    line_start = re.search(r"(?:^|\n)\s*([a-d])[.:)\s]", lower)
-    if line_start:
-        return line_start.group(1)
+    # Passes 2-4 in one scan, keeping the earliest match of the best pass:
+    #   2. "answer is (a)" or "answer is a" patterns
+    #   3. bold letter like **a**, **b**
+    #   4. letter followed by period/colon at start of line — "a. " or "a: "
+    best = None
+    best_rank = len(_MC_MARKER_RANK)
+    for m in _MC_MARKER_RE.finditer(lower):
+        rank = _MC_MARKER_RANK[m.lastgroup]
+        if rank < best_rank:
+            best, best_rank = m.group(m.lastgroup), rank
+            if rank == 0:
+                break
+    if best is not None:
+        return best
 
     # Pass 5: first standalone letter a-d in the response
-    for char in cleaned:
-        if char.lower() in "abcd":
-            return char.lower()
+    m = _MC_ANY_LETTER_RE.search(cleaned)
+    if m:
+        return m.group(0).lower()
 
     return "?"
 
@@ -477,10 +549,15 @@ def grade_question(
 
 def _score_summary(graded: List[GradedQuestion]) -> Tuple[int, int, int, int, float]:
     """Return (total, correct, incorrect, ungraded, accuracy)."""
+    correct = incorrect = ungraded = 0
+    for g in graded:
+        if g.is_correct is True:
+            correct += 1
+        elif g.is_correct is False:
+            incorrect += 1
+        else:
+            ungraded += 1
     total = len(graded)
-    correct = sum(1 for g in graded if g.is_correct is True)
-    incorrect = sum(1 for g in graded if g.is_correct is False)
-    ungraded = sum(1 for g in graded if g.is_correct is None)
     gradable = total - ungraded
     accuracy = correct / gradable if gradable > 0 else 0.0
     return total, correct, incorrect, ungraded, accuracy
@@ -491,51 +568,81 @@ def _score_summary(graded: List[GradedQuestion]) -> Tuple[int, int, int, int, fl
 # ---------------------------------------------------------------------------
 
 def write_results(graded: List[GradedQuestion], output_path: str, metadata: Dict) -> str:
+    """
+    Write a markdown results report, plus a .json sibling with the same
+    data for tools that want to reload or aggregate results.
+    """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
     total, correct, incorrect, ungraded, accuracy = _score_summary(graded)
     score_sum = sum(g.score for g in graded)
 
+    json_path = path.with_suffix(".json")
+    if json_path != path:
+        write_json(json_path, {
+            "metadata": metadata,
+            "summary": {
+                "total": total,
+                "correct": correct,
+                "incorrect": incorrect,
+                "ungraded": ungraded,
+                "accuracy": accuracy,
+                "score": score_sum,
+            },
+            "graded": [asdict(g) for g in graded],
+        })
+
+    # Build the whole report in memory and write it once
+    parts: List[str] = ["# Quiz Results\n\n"]
+    if metadata.get("title"):
+        parts.append(f"- **Quiz:** {metadata['title']}\n")
+    parts.append(f"- **Mode:** {metadata.get('mode', '?')}\n")
+    parts.append(f"- **RAG:** {'yes' if metadata.get('use_rag') else 'no'}\n")
+    parts.append(f"- **Grounded:** {'yes' if metadata.get('grounded', True) else 'no (broad)'}\n")
+    if metadata.get("sections"):
+        parts.append(f"- **Sections:** {metadata['sections']}\n")
+    if metadata.get("limit"):
+        parts.append(f"- **Limit:** {metadata['limit']} questions\n")
+    parts.append(
+        f"- **Total:** {total}\n"
+        f"- **Correct:** {correct}\n"
+        f"- **Incorrect:** {incorrect}\n"
+        f"- **Ungraded (SA):** {ungraded}\n"
+        f"- **Accuracy:** {accuracy * 100:.0f}%\n"
+        f"- **Score:** {score_sum:.0f}\n\n---\n\n"
+    )
+
+    # One formatted section per question; optional blocks render as ""
+    for g in graded:
+        q = g.question
+        icon = "?" if g.is_correct is None else ("+" if g.is_correct else "x")
+        ellipsis = "..." if len(q.text) > 200 else ""
+        code = f"```\n{q.code}\n```\n\n" if q.code else ""
+        choices = (
+            "Choices:\n" + "".join(f"  {c}\n" for c in q.choices) + "\n"
+            if q.choices else ""
+        )
+        explanation = (
+            f"**Explanation:** {g.correct_explanation}\n\n"
+            if g.correct_explanation else ""
+        )
+        full_response = (
+            f"**Full LLM response:**\n{g.llm_answer[:500]}\n\n"
+            if q.qtype == "sa" else ""
+        )
+        parts.append(
+            f"## [{icon}] {q.id}\n\n"
+            f"**Question:** {q.text[:200]}{ellipsis}\n\n"
+            f"{code}{choices}"
+            f"**LLM answer:** {g.llm_extracted}\n\n"
+            f"**Correct:** {g.correct_answer}\n\n"
+            f"{explanation}{full_response}"
+            "---\n\n"
+        )
+
     with open(path, "w", encoding="utf-8") as f:
-        f.write("# Quiz Results\n\n")
-        if metadata.get("title"):
-            f.write(f"- **Quiz:** {metadata['title']}\n")
-        f.write(f"- **Mode:** {metadata.get('mode', '?')}\n")
-        f.write(f"- **RAG:** {'yes' if metadata.get('use_rag') else 'no'}\n")
-        f.write(f"- **Grounded:** {'yes' if metadata.get('grounded', True) else 'no (broad)'}\n")
-        if metadata.get("sections"):
-            f.write(f"- **Sections:** {metadata['sections']}\n")
-        if metadata.get("limit"):
-            f.write(f"- **Limit:** {metadata['limit']} questions\n")
-        f.write(f"- **Total:** {total}\n")
-        f.write(f"- **Correct:** {correct}\n")
-        f.write(f"- **Incorrect:** {incorrect}\n")
-        f.write(f"- **Ungraded (SA):** {ungraded}\n")
-        f.write(f"- **Accuracy:** {accuracy * 100:.0f}%\n")
-        f.write(f"- **Score:** {score_sum:.0f}\n\n---\n\n")
-
-        for g in graded:
-            icon = "?" if g.is_correct is None else ("+" if g.is_correct else "x")
-            f.write(f"## [{icon}] {g.question.id}\n\n")
-            f.write(f"**Question:** {g.question.text[:200]}")
-            if len(g.question.text) > 200:
-                f.write("...")
-            f.write("\n\n")
-            if g.question.code:
-                f.write(f"```\n{g.question.code}\n```\n\n")
-            if g.question.choices:
-                f.write("Choices:\n")
-                for c in g.question.choices:
-                    f.write(f"  {c}\n")
-                f.write("\n")
-            f.write(f"**LLM answer:** {g.llm_extracted}\n\n")
-            f.write(f"**Correct:** {g.correct_answer}\n\n")
-            if g.correct_explanation:
-                f.write(f"**Explanation:** {g.correct_explanation}\n\n")
-            if g.question.qtype == "sa":
-                f.write(f"**Full LLM response:**\n{g.llm_answer[:500]}\n\n")
-            f.write("---\n\n")
+        f.write("".join(parts))
 
     return str(path)
 
@@ -544,47 +651,56 @@ def write_results(graded: List[GradedQuestion], output_path: str, metadata: Dict
 # Prompt builder for quiz questions
 # ---------------------------------------------------------------------------
 
+_TF_INSTR = (
+    "Answer this True/False question. Start your response with "
+    "exactly 'True' or 'False', then briefly explain why."
+)
+_MC_INSTR = (
+    "Answer this multiple choice question. Start your response with "
+    "the letter of the correct choice in parentheses, e.g. (a), "
+    "then briefly explain why."
+)
+_SA_INSTR = (
+    "Answer this short answer question concisely but completely. "
+    "Focus on technical accuracy."
+)
+
+
+def _quiz_prompt_body(question: Question) -> str:
+    """The config-independent part of a quiz prompt: instruction + question."""
+    parts = [
+        _TF_INSTR if question.qtype == "tf"
+        else _MC_INSTR if question.qtype == "mc"
+        else _SA_INSTR,
+        question.text,
+    ]
+
+    if question.code:
+        parts.append(f"```\n{question.code}\n```")
+
+    if question.choices:
+        parts.append("\n".join(question.choices))
+
+    return "\n\n".join(parts)
+
+
 def build_quiz_prompt(
     question: Question,
     rag_context: Optional[str] = None,
+    body: Optional[str] = None,
 ) -> str:
     """
     Build a focused prompt for a quiz question.
 
     Uses tighter instructions than general chat to get concise,
-    extractable answers.
+    extractable answers. Pass body (from _quiz_prompt_body) to reuse a
+    prompt body built once for several configs.
     """
-    parts = []
-
+    if body is None:
+        body = _quiz_prompt_body(question)
     if rag_context:
-        parts.append(f"Documentation context:\n{rag_context}")
-
-    if question.qtype == "tf":
-        parts.append(
-            "Answer this True/False question. Start your response with "
-            "exactly 'True' or 'False', then briefly explain why."
-        )
-    elif question.qtype == "mc":
-        parts.append(
-            "Answer this multiple choice question. Start your response with "
-            "the letter of the correct choice in parentheses, e.g. (a), "
-            "then briefly explain why."
-        )
-    else:
-        parts.append(
-            "Answer this short answer question concisely but completely. "
-            "Focus on technical accuracy."
-        )
-
-    parts.append(question.text)
-
-    if question.code:
-        parts.append(f"```\n{question.code}\n```")
-
-    if question.choices:
-        parts.append("\n".join(question.choices))
-
-    return "\n\n".join(parts)
+        return f"Documentation context:\n{rag_context}\n\n{body}"
+    return body
 
 
 # ---------------------------------------------------------------------------
@@ -598,14 +714,38 @@ def _load_questions(
     """
     Load questions from a .md or .json quiz file.
     Returns (questions, answer_key, metadata).
+
+    Parsed files are cached by (path, mtime, quiz_id), so repeated runs over
+    an unchanged file skip parsing. Each call gets its own copies of the
+    questions and answer key entries, so callers can mutate them freely.
     """
     path = Path(quiz_path)
     if not path.exists():
         raise FileNotFoundError(f"Quiz file not found: {quiz_path}")
 
+    questions, answer_key, meta = _parse_quiz_file(
+        str(path.resolve()), path.stat().st_mtime, quiz_id
+    )
+    if not questions:
+        raise ValueError(f"No questions found in {quiz_path}")
+
+    return (
+        [replace(q, choices=list(q.choices)) for q in questions],
+        {qid: replace(e) for qid, e in answer_key.items()},
+        dict(meta),
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_quiz_file(
+    quiz_path: str,
+    mtime: float,
+    quiz_id: Optional[str],
+) -> Tuple[List[Question], Dict[str, AnswerKeyEntry], dict]:
+    """Parse a quiz file; mtime is only part of the cache key."""
+    path = Path(quiz_path)
     if path.suffix.lower() == ".json":
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(path)
         questions, answer_key, meta = parse_json_quiz(data, quiz_id=quiz_id)
     else:
         content = path.read_text(encoding="utf-8")
@@ -614,20 +754,28 @@ def _load_questions(
         answer_key = {e.id: e for e in answer_key_list}
         meta = {"title": path.stem}
 
-    if not questions:
-        raise ValueError(f"No questions found in {quiz_path}")
-
     return questions, answer_key, meta
 
 
+def _sections_label(sections: Optional[Set[str]]) -> Optional[str]:
+    """Display form of a section filter, e.g. "mc,tf"; None if unfiltered."""
+    return ",".join(sorted(sections)) if sections else None
+
+
 def _apply_filters(
     questions: List[Question],
     answer_key: Dict[str, AnswerKeyEntry],
     sections: Optional[Set[str]] = None,
     limit: Optional[int] = None,
     shuffle: bool = False,
+    sections_label: Optional[str] = None,
+    echo: Callable[..., None] = print,
 ) -> Tuple[List[Question], Dict[str, AnswerKeyEntry]]:
-    """Apply section filter and limit, printing what was filtered."""
+    """
+    Apply section filter and limit, printing what was filtered.
+
+    Callers that filter repeatedly can pass a precomputed sections_label.
+    """
     original_count = len(questions)
     questions, answer_key = filter_questions(
         questions, answer_key, sections=sections, limit=limit, shuffle=shuffle
@@ -635,10 +783,10 @@ def _apply_filters(
     if sections or limit:
         parts = []
         if sections:
-            parts.append(f"sections={','.join(sorted(sections))}")
+            parts.append(f"sections={sections_label or _sections_label(sections)}")
         if limit:
             parts.append(f"limit={limit}")
-        print(f"  Filtered: {original_count} -> {len(questions)} ({', '.join(parts)})")
+        echo(f"  Filtered: {original_count} -> {len(questions)} ({', '.join(parts)})")
     return questions, answer_key
 
 
@@ -656,15 +804,24 @@ def run_quiz(
     grounded: bool = True,
     sections: Optional[Set[str]] = None,
     limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
 ) -> str:
-    """Run a full quiz from a markdown file: parse, query LLM, grade, write results."""
+    """
+    Run a full quiz from a markdown file: parse, query LLM, grade, write results.
+
+    concurrency caps in-flight Ollama requests (default QUIZ_CONCURRENCY).
+    """
     questions, answer_key, meta = _load_questions(quiz_path)
     print(f"Parsed {len(questions)} questions, {len(answer_key)} answer key entries")
 
-    questions, answer_key = _apply_filters(questions, answer_key, sections, limit)
+    sections_label = _sections_label(sections)
+    questions, answer_key = _apply_filters(
+        questions, answer_key, sections, limit, sections_label=sections_label
+    )
 
     graded = _run_questions(
-        questions, answer_key, processor, mode, use_rag, n_results, grounded
+        questions, answer_key, processor, mode, use_rag, n_results, grounded,
+        max_workers=concurrency,
     )
 
     result_path = write_results(
@@ -674,7 +831,7 @@ def run_quiz(
             "mode": mode,
             "use_rag": use_rag,
             "grounded": grounded,
-            "sections": ",".join(sorted(sections)) if sections else None,
+            "sections": sections_label,
             "limit": limit,
         },
     )
@@ -692,18 +849,27 @@ def run_json_quiz(
     grounded: bool = True,
     sections: Optional[Set[str]] = None,
     limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
 ) -> str:
-    """Run a full quiz from a JSON file: parse, query LLM, grade, write results."""
+    """
+    Run a full quiz from a JSON file: parse, query LLM, grade, write results.
+
+    concurrency caps in-flight Ollama requests (default QUIZ_CONCURRENCY).
+    """
     questions, answer_key, quiz_meta = _load_questions(quiz_path, quiz_id=quiz_id)
 
     title = quiz_meta.get("title", Path(quiz_path).stem)
     print(f"Quiz: {title}")
     print(f"Parsed {len(questions)} questions, {len(answer_key)} answer key entries")
 
-    questions, answer_key = _apply_filters(questions, answer_key, sections, limit)
+    sections_label = _sections_label(sections)
+    questions, answer_key = _apply_filters(
+        questions, answer_key, sections, limit, sections_label=sections_label
+    )
 
     graded = _run_questions(
-        questions, answer_key, processor, mode, use_rag, n_results, grounded
+        questions, answer_key, processor, mode, use_rag, n_results, grounded,
+        max_workers=concurrency,
     )
 
     result_path = write_results(
@@ -715,13 +881,96 @@ def run_json_quiz(
             "grounded": grounded,
             "title": title,
             "quiz_id": quiz_meta.get("quiz_id", ""),
-            "sections": ",".join(sorted(sections)) if sections else None,
+            "sections": sections_label,
             "limit": limit,
         },
     )
     return result_path
 
 
+def _answer_settled(partial: str, qtype: str) -> bool:
+    """
+    True once a partial TF/MC response already fixes extract_answer's result.
+
+    Only first-pass matches qualify: a response that starts with True/False,
+    or the first parenthesised letter. Nothing generated afterwards can
+    change either outcome.
+    """
+    if qtype == "tf":
+        return partial.lower().lstrip(_TF_LEAD_CHARS).startswith(("true", "false"))
+    if qtype == "mc":
+        return _MC_PAREN_RE.search(partial) is not None
+    return False
+
+
+def _chat_until_settled(model: str, prompt: str, options: dict, qtype: str) -> str:
+    """Stream a quiz answer, closing the stream once the answer is settled."""
+    stream = _ollama.chat(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        options=options,
+        stream=True,
+    )
+    parts: List[str] = []
+    # _answer_settled only ever needs a bounded view of the response: the
+    # opening characters for tf, and for mc the newest token plus a 2-char
+    # overlap so a "(b)" split across tokens is still seen.
+    probe: Optional[str] = ""
+    try:
+        for chunk in stream:
+            token = chunk["message"]["content"]
+            parts.append(token)
+            if probe is None:
+                continue
+            probe = probe + token if qtype == "tf" else probe[-2:] + token
+            if _answer_settled(probe, qtype):
+                break
+            if qtype == "tf" and len(probe.lstrip(_TF_LEAD_CHARS)) >= 5:
+                probe = None  # opening word is neither True nor False
+    finally:
+        # Closing the stream drops the connection, which stops generation
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    return "".join(parts)
+
+
+def _fetch_rag_contexts(
+    questions: List[Question],
+    processor,
+    n_results: int,
+) -> List[Optional[str]]:
+    """
+    Retrieve RAG context for each question, in question order.
+
+    Uses one batched query when the processor supports it; otherwise, or if
+    the batch fails, queries per question. Failed lookups yield None.
+    """
+    batch_results = None
+    if hasattr(processor, "query_batch"):
+        try:
+            batch_results = processor.query_batch(
+                [q.text for q in questions], n_results=n_results
+            )
+        except Exception as e:
+            logger.warning(f"Batched RAG query failed, querying per question: {e}")
+
+    contexts: List[Optional[str]] = []
+    for i, q in enumerate(questions):
+        context = None
+        try:
+            if batch_results is not None:
+                results = batch_results[i]
+            else:
+                results = processor.query(q.text, n_results=n_results)
+            if results["documents"][0]:
+                context = "\n".join(results["documents"][0][:n_results])
+        except Exception as e:
+            logger.warning(f"RAG query failed for {q.id}: {e}")
+        contexts.append(context)
+    return contexts
+
+
 def _run_questions(
     questions: List[Question],
     answer_key: Dict[str, AnswerKeyEntry],
@@ -730,55 +979,118 @@ def _run_questions(
     use_rag: bool,
     n_results: int,
     grounded: bool,
+    max_workers: Optional[int] = None,
+    use_cache: Optional[bool] = None,
+    rag_contexts: Optional[List[Optional[str]]] = None,
+    early_stop: Optional[bool] = None,
+    prompt_bodies: Optional[List[str]] = None,
+    echo: Callable[..., None] = print,
 ) -> List[GradedQuestion]:
-    """Shared logic: send each question to Ollama, grade, return results."""
-    import ollama as _ollama
-    from backend.config import CHAT_MODELS, QUIZ_OPTIONS, QUIZ_NUM_PREDICT
+    """
+    Shared logic: send questions to Ollama, grade, return results.
 
-    llm_model = CHAT_MODELS.get(mode, CHAT_MODELS["qwen-7b"])
-    base_options = QUIZ_OPTIONS.get(mode, QUIZ_OPTIONS["qwen-7b"])
-    graded: List[GradedQuestion] = []
+    Up to max_workers questions (default QUIZ_CONCURRENCY) are in flight
+    at once; results are graded and printed in question order. With one
+    worker, each question's progress line is printed before its call.
 
-    for i, q in enumerate(questions):
-        print(f"  [{i + 1}/{len(questions)}] {q.id}...", end=" ", flush=True)
+    rag_contexts, if given, supplies each question's already-retrieved
+    context (see _fetch_rag_contexts) instead of querying processor;
+    prompt_bodies likewise supplies prebuilt _quiz_prompt_body strings.
 
-        # Build RAG context
-        rag_context = None
-        if use_rag and processor is not None:
-            try:
-                results = processor.query(q.text, n_results=n_results)
-                if results["documents"][0]:
-                    rag_context = "\n".join(results["documents"][0][:n_results])
-            except Exception as e:
-                logger.warning(f"RAG query failed for {q.id}: {e}")
+    With early_stop (default QUIZ_EARLY_STOP), TF/MC answers are streamed
+    and generation stops as soon as the graded answer can no longer change.
+
+    With use_cache (default LLM_CACHE_ENABLED), responses are read from and
+    written to the on-disk response cache, skipping inference on a hit.
 
-        prompt = build_quiz_prompt(q, rag_context=rag_context)
+    Progress goes through echo (print by default), so parallel callers can
+    collect each run's output and print it as one block.
+    """
+    if _ollama is None:
+        raise RuntimeError(
+            "The ollama package is required to run quizzes: pip install ollama"
+        )
 
-        # Per-question-type token limit
-        options = {
-            **base_options,
-            "num_predict": QUIZ_NUM_PREDICT.get(q.qtype, 512),
-        }
+    llm_model = CHAT_MODELS.get(mode, CHAT_MODELS["qwen-7b"])
+    base_options = QUIZ_OPTIONS.get(mode, QUIZ_OPTIONS["qwen-7b"])
+    # Per-question-type token limit; shared read-only across questions
+    options_by_qtype = {
+        qtype: {**base_options, "num_predict": QUIZ_NUM_PREDICT.get(qtype, 512)}
+        for qtype in ("tf", "mc", "sa")
+    }
+    if max_workers is None:
+        max_workers = QUIZ_CONCURRENCY
+    if use_cache is None:
+        use_cache = LLM_CACHE_ENABLED
+    if early_stop is None:
+        early_stop = QUIZ_EARLY_STOP
+
+    if rag_contexts is None:
+        if use_rag and processor is not None:
+            rag_contexts = _fetch_rag_contexts(questions, processor, n_results)
+        else:
+            rag_contexts = [None] * len(questions)
+
+    def ask(i: int, q: Question) -> str:
+        prompt = build_quiz_prompt(
+            q,
+            rag_context=rag_contexts[i],
+            body=prompt_bodies[i] if prompt_bodies is not None else None,
+        )
+        options = options_by_qtype[q.qtype]
+        stop_early = early_stop and q.qtype in ("tf", "mc")
+
+        cache_key = None
+        if use_cache:
+            # Truncated responses must not be served to full-response runs
+            key_options = {**options, "early_stop": True} if stop_early else options
+            cache_key = response_cache.make_key(llm_model, key_options, prompt)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            response = _ollama.chat(
-                model=llm_model,
-                messages=[{"role": "user", "content": prompt}],
-                options=options,
-            )
-            llm_answer = response["message"]["content"]
+            with _llm_slots:
+                if stop_early:
+                    llm_answer = _chat_until_settled(llm_model, prompt, options, q.qtype)
+                else:
+                    response = _ollama.chat(
+                        model=llm_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        options=options,
+                    )
+                    llm_answer = response["message"]["content"]
         except Exception as e:
-            llm_answer = f"[error: {e}]"
+            # Errors are never cached so a rerun retries them
+            return f"[error: {e}]"
 
-        result = grade_question(q, llm_answer, answer_key)
-        graded.append(result)
+        if cache_key is not None:
+            response_cache.put(cache_key, llm_answer)
+        return llm_answer
 
-        icon = "?" if result.is_correct is None else ("+" if result.is_correct else "x")
-        print(f"[{icon}]")
+    graded: List[GradedQuestion] = []
+
+    def icon_for(result: GradedQuestion) -> str:
+        return "?" if result.is_correct is None else ("+" if result.is_correct else "x")
+
+    if max_workers <= 1:
+        for i, q in enumerate(questions):
+            echo(f"  [{i + 1}/{len(questions)}] {q.id}...", end=" ", flush=True)
+            result = grade_question(q, ask(i, q), answer_key)
+            graded.append(result)
+            echo(f"[{icon_for(result)}]")
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # map() yields in submission order even when later questions finish first
+            answers = pool.map(ask, range(len(questions)), questions)
+            for i, (q, llm_answer) in enumerate(zip(questions, answers)):
+                result = grade_question(q, llm_answer, answer_key)
+                graded.append(result)
+                echo(f"  [{i + 1}/{len(questions)}] {q.id}... [{icon_for(result)}]")
 
     # Print summary
     total, correct, incorrect, ungraded, accuracy = _score_summary(graded)
-    print(f"\n  Score: {correct}/{total - ungraded} "
+    echo(f"\n  Score: {correct}/{total - ungraded} "
           f"({accuracy * 100:.0f}%)"
           f"  |  {ungraded} SA ungraded")
 
@@ -789,7 +1101,7 @@ def _run_questions(
 # Benchmark
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkConfig:
     """A single configuration to test in a benchmark run."""
     mode: str
@@ -825,6 +1137,108 @@ DEFAULT_BENCHMARK_CONFIGS = [
 ]
 
 
+class _OutputBuffer:
+    """Collects print()-style output so a parallel run can emit it in one block."""
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def print(self, *args, sep: str = " ", end: str = "\n", flush: bool = False) -> None:
+        self._parts.append(sep.join(map(str, args)) + end)
+
+    def getvalue(self) -> str:
+        return "".join(self._parts)
+
+
+def _run_configs(
+    configs: List[BenchmarkConfig],
+    questions: List[Question],
+    answer_key: Dict[str, AnswerKeyEntry],
+    processor,
+    n_results: int,
+    parallel_configs: int = 1,
+    indent: str = "",
+    concurrency: Optional[int] = None,
+    echo: Callable[..., None] = print,
+) -> List[BenchmarkResult]:
+    """
+    Run every config over the same question set; results are in config order.
+
+    With parallel_configs > 1, configs for different models run concurrently
+    while configs sharing a model stay serial, so Ollama can keep that model
+    loaded between them instead of swapping it in and out. Each parallel
+    run's progress is buffered and printed as one block when it finishes,
+    so runs never interleave on the console.
+
+    RAG context is retrieved once and shared by every RAG-enabled config;
+    the config-independent prompt bodies are likewise built once.
+    """
+    rag_contexts = None
+    if processor is not None and any(cfg.use_rag for cfg in configs):
+        rag_contexts = _fetch_rag_contexts(questions, processor, n_results)
+    prompt_bodies = [_quiz_prompt_body(q) for q in questions]
+
+    def run_one(
+        ci: int, cfg: BenchmarkConfig, echo: Callable[..., None]
+    ) -> BenchmarkResult:
+        echo(f"\n{indent}--- Run {ci + 1}/{len(configs)}: {cfg.label} ---")
+
+        run_processor = processor if cfg.use_rag else None
+
+        t0 = time.perf_counter()
+        graded = _run_questions(
+            questions, answer_key, run_processor,
+            cfg.mode, cfg.use_rag, n_results, cfg.grounded,
+            max_workers=concurrency,
+            rag_contexts=rag_contexts if cfg.use_rag else None,
+            prompt_bodies=prompt_bodies,
+            echo=echo,
+        )
+        elapsed = time.perf_counter() - t0
+
+        total, correct, incorrect, ungraded, accuracy = _score_summary(graded)
+
+        return BenchmarkResult(
+            label=cfg.label,
+            mode=cfg.mode,
+            use_rag=cfg.use_rag,
+            grounded=cfg.grounded,
+            total=total,
+            correct=correct,
+            incorrect=incorrect,
+            ungraded=ungraded,
+            accuracy=accuracy,
+            elapsed=elapsed,
+            graded=graded,
+        )
+
+    if parallel_configs <= 1:
+        return [run_one(ci, cfg, echo) for ci, cfg in enumerate(configs)]
+
+    by_mode: Dict[str, List[int]] = {}
+    for ci, cfg in enumerate(configs):
+        by_mode.setdefault(cfg.mode, []).append(ci)
+
+    results: List[Optional[BenchmarkResult]] = [None] * len(configs)
+    echo_lock = threading.Lock()
+
+    def run_group(indices: List[int]) -> None:
+        for ci in indices:
+            out = _OutputBuffer()
+            try:
+                results[ci] = run_one(ci, configs[ci], out.print)
+            finally:
+                with echo_lock:
+                    echo(out.getvalue(), end="", flush=True)
+
+    with ThreadPoolExecutor(max_workers=parallel_configs) as pool:
+        futures = [pool.submit(run_group, indices) for indices in by_mode.values()]
+        for future in futures:
+            future.result()
+
+    return results
+
+
 def run_benchmark(
     quiz_path: str,
     output_path: str,
@@ -834,12 +1248,16 @@ def run_benchmark(
     n_results: int = 4,
     sections: Optional[Set[str]] = None,
     limit: Optional[int] = None,
+    parallel_configs: int = 1,
+    concurrency: Optional[int] = None,
 ) -> str:
     """
     Run the same quiz across multiple configurations and write a comparison report.
 
     Each config is a (mode, use_rag, grounded) tuple. The same question set
-    is used for all runs to ensure a fair comparison.
+    is used for all runs to ensure a fair comparison. parallel_configs > 1
+    runs configs for different models concurrently; concurrency caps
+    in-flight requests within each config.
     """
     if configs is None:
         configs = DEFAULT_BENCHMARK_CONFIGS
@@ -855,45 +1273,24 @@ def run_benchmark(
     print(f"  Total questions: {len(questions)}")
 
     questions, answer_key = _apply_filters(
-        questions, answer_key, sections, limit
+        questions, answer_key, sections, limit,
+        sections_label=_sections_label(sections),
     )
 
     print(f"  Configurations: {len(configs)}")
     print(f"  Estimated inferences: {len(configs) * len(questions)}")
     print(f"{'=' * 60}\n")
 
-    results: List[BenchmarkResult] = []
-
-    for ci, cfg in enumerate(configs):
-        print(f"\n--- Run {ci + 1}/{len(configs)}: {cfg.label} ---")
-
-        run_processor = processor if cfg.use_rag else None
-
-        t0 = time.time()
-        graded = _run_questions(
-            questions, answer_key, run_processor,
-            cfg.mode, cfg.use_rag, n_results, cfg.grounded,
-        )
-        elapsed = time.time() - t0
-
-        total, correct, incorrect, ungraded, accuracy = _score_summary(graded)
-
-        results.append(BenchmarkResult(
-            label=cfg.label,
-            mode=cfg.mode,
-            use_rag=cfg.use_rag,
-            grounded=cfg.grounded,
-            total=total,
-            correct=correct,
-            incorrect=incorrect,
-            ungraded=ungraded,
-            accuracy=accuracy,
-            elapsed=elapsed,
-            graded=graded,
-        ))
+    results = _run_configs(
+        configs, questions, answer_key, processor, n_results, parallel_configs,
+        concurrency=concurrency,
+    )
 
     # Write comparison report
-    report_path = _write_benchmark_report(results, output_path, title, meta)
+    report_path = _write_benchmark_report(
+        results, output_path, title, meta,
+        timing_note=_timing_note(concurrency, parallel_configs),
+    )
 
     # Print summary table
     _print_benchmark_table(results)
@@ -901,28 +1298,99 @@ def run_benchmark(
     return report_path
 
 
-def _print_benchmark_table(results: List[BenchmarkResult]) -> None:
-    """Print a formatted comparison table to stdout."""
-    print(f"\n{'=' * 80}")
-    print(f"  BENCHMARK RESULTS")
-    print(f"{'=' * 80}")
-    print(f"  {'Config':<35s} {'Acc':>6s} {'Correct':>8s} {'Time':>8s} {'Per-Q':>7s}")
-    print(f"  {'-' * 35} {'-' * 6} {'-' * 8} {'-' * 8} {'-' * 7}")
+def _print_benchmark_table(
+    results: List[BenchmarkResult], echo: Callable[..., None] = print
+) -> None:
+    """Print a formatted comparison table to stdout (or through echo)."""
+    echo(f"\n{'=' * 80}")
+    echo(f"  BENCHMARK RESULTS")
+    echo(f"{'=' * 80}")
+    echo(f"  {'Config':<35s} {'Acc':>6s} {'Correct':>8s} {'Time':>8s} {'Per-Q':>7s}")
+    echo(f"  {'-' * 35} {'-' * 6} {'-' * 8} {'-' * 8} {'-' * 7}")
 
     ranked = sorted(results, key=lambda r: r.accuracy, reverse=True)
 
     for r in ranked:
-        gradable = r.total - r.ungraded
-        per_q = r.elapsed / r.total if r.total > 0 else 0
-        print(
+        echo(
             f"  {r.label:<35s} "
             f"{r.accuracy * 100:5.1f}% "
-            f"{r.correct:>3d}/{gradable:<3d} "
+            f"{r.correct:>3d}/{r.gradable:<3d} "
             f"{r.elapsed:>6.1f}s "
-            f"{per_q:>5.1f}s"
+            f"{r.per_q:>5.1f}s"
         )
 
-    print(f"{'=' * 80}\n")
+    echo(f"{'=' * 80}\n")
+
+
+def _index_by_qid(graded: List[GradedQuestion]) -> Dict[str, GradedQuestion]:
+    """Map question id -> graded result; the first occurrence of an id wins."""
+    index: Dict[str, GradedQuestion] = {}
+    for g in graded:
+        index.setdefault(g.question.id, g)
+    return index
+
+
+def _md_row(cells: List[str]) -> str:
+    """Render one markdown table row."""
+    return "| " + " | ".join(cells) + " |\n"
+
+
+def _summary_rows(ranked: List[BenchmarkResult]) -> List[str]:
+    """Rows of the Rank/Config/Accuracy/Correct/Time/Per-Q summary table."""
+    return [
+        f"| {rank} | {r.label} | "
+        f"{r.accuracy * 100:.1f}% | "
+        f"{r.correct}/{r.gradable} | "
+        f"{r.elapsed:.1f}s | "
+        f"{r.per_q:.1f}s |\n"
+        for rank, r in enumerate(ranked, 1)
+    ]
+
+
+def _grade_cell(g: Optional[GradedQuestion]) -> str:
+    """Per-question table cell: - missing, ? ungraded, + right, x (answer) wrong."""
+    if g is None:
+        return "-"
+    if g.is_correct is None:
+        return "?"
+    if g.is_correct:
+        return "+"
+    return f"x ({g.llm_extracted})"
+
+
+def _format_breakdown_table(
+    qids: List[str],
+    ranked: List[BenchmarkResult],
+    ranked_indexes: List[Dict[str, GradedQuestion]],
+) -> str:
+    """Per-question table: a row per question id, a column per ranked config."""
+    rows = [
+        _md_row(["Question"] + [r.label for r in ranked]),
+        "|----------|" + "------|" * len(ranked) + "\n",
+    ]
+    rows.extend(
+        _md_row([qid] + [_grade_cell(index.get(qid)) for index in ranked_indexes])
+        for qid in qids
+    )
+    return "".join(rows)
+
+
+def _timing_note(concurrency: Optional[int], parallel_configs: int) -> str:
+    """
+    Report header line flagging concurrent timings, or "" for a sequential
+    run. Time/Per-Q from concurrent runs are wall-clock under contention,
+    not per-question latency, so they must not be compared with
+    sequential runs.
+    """
+    if concurrency is None:
+        concurrency = QUIZ_CONCURRENCY
+    if concurrency <= 1 and parallel_configs <= 1:
+        return ""
+    return (
+        f"**Timing:** {max(1, concurrency)} question(s) in flight per config, "
+        f"{parallel_configs} config(s) at once; Time and Per-Q are wall-clock "
+        f"under contention, not comparable with sequential runs.\n\n"
+    )
 
 
 def _write_benchmark_report(
@@ -930,6 +1398,7 @@ def _write_benchmark_report(
     output_path: str,
     title: str,
     meta: dict,
+    timing_note: str = "",
 ) -> str:
     """Write a detailed benchmark comparison report."""
     path = Path(output_path)
@@ -937,91 +1406,72 @@ def _write_benchmark_report(
 
     ranked = sorted(results, key=lambda r: r.accuracy, reverse=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("# Benchmark Report\n\n")
-        f.write(f"**Quiz:** {title}\n\n")
-
-        # Summary table
-        f.write("## Summary\n\n")
-        f.write("| Rank | Config | Accuracy | Correct | Time | Per-Q |\n")
-        f.write("|------|--------|----------|---------|------|-------|\n")
-
-        for rank, r in enumerate(ranked, 1):
-            gradable = r.total - r.ungraded
-            per_q = r.elapsed / r.total if r.total > 0 else 0
-            f.write(
-                f"| {rank} | {r.label} | "
-                f"{r.accuracy * 100:.1f}% | "
-                f"{r.correct}/{gradable} | "
-                f"{r.elapsed:.1f}s | "
-                f"{per_q:.1f}s |\n"
-            )
+    # Assemble the report in memory and write it with one call
+    out = io.StringIO()
+    out.write("# Benchmark Report\n\n")
+    out.write(f"**Quiz:** {title}\n\n")
+    out.write(timing_note)
 
-        f.write("\n---\n\n")
-
-        # Per-question comparison
-        f.write("## Per-Question Breakdown\n\n")
-
-        all_qids = [q.question.id for q in results[0].graded]
-
-        f.write("| Question |")
-        for r in ranked:
-            f.write(f" {r.label} |")
-        f.write("\n")
-        f.write("|----------|")
-        for _ in ranked:
-            f.write("------|")
-        f.write("\n")
-
-        for qid in all_qids:
-            f.write(f"| {qid} |")
-            for r in ranked:
-                g = next((g for g in r.graded if g.question.id == qid), None)
-                if g is None:
-                    f.write(" - |")
-                elif g.is_correct is None:
-                    f.write(" ? |")
-                elif g.is_correct:
-                    f.write(" + |")
-                else:
-                    f.write(f" x ({g.llm_extracted}) |")
-            f.write("\n")
+    # Summary table
+    out.write("## Summary\n\n")
+    out.write("| Rank | Config | Accuracy | Correct | Time | Per-Q |\n")
+    out.write("|------|--------|----------|---------|------|-------|\n")
 
-        f.write("\n---\n\n")
+    out.write("".join(_summary_rows(ranked)))
 
-        # Disagreements
-        f.write("## Disagreements\n\n")
-        f.write("Questions where at least one config got it right and another wrong:\n\n")
+    out.write("\n---\n\n")
 
-        disagreement_count = 0
-        for qid in all_qids:
-            grades = {}
-            for r in results:
-                g = next((g for g in r.graded if g.question.id == qid), None)
-                if g and g.is_correct is not None:
-                    grades[r.label] = g
+    # Per-question comparison
+    out.write("## Per-Question Breakdown\n\n")
 
-            if not grades:
-                continue
+    all_qids = [q.question.id for q in results[0].graded]
+
+    # One id -> graded index per result, in both run and ranked order
+    indexed = [(r, _index_by_qid(r.graded)) for r in results]
+    ranked_indexes = [
+        index for _, index in
+        sorted(indexed, key=lambda pair: pair[0].accuracy, reverse=True)
+    ]
+
+    out.write(_format_breakdown_table(all_qids, ranked, ranked_indexes))
+
+    out.write("\n---\n\n")
+
+    # Disagreements
+    out.write("## Disagreements\n\n")
+    out.write("Questions where at least one config got it right and another wrong:\n\n")
+
+    disagreement_count = 0
+    for qid in all_qids:
+        grades = {}
+        for r, index in indexed:
+            g = index.get(qid)
+            if g and g.is_correct is not None:
+                grades[r.label] = g
 
-            correct_configs = [la for la, g in grades.items() if g.is_correct]
-            wrong_configs = [la for la, g in grades.items() if not g.is_correct]
-
-            if correct_configs and wrong_configs:
-                disagreement_count += 1
-                sample_g = list(grades.values())[0]
-                f.write(f"### {qid}\n\n")
-                f.write(f"**Question:** {sample_g.question.text[:200]}\n\n")
-                f.write(f"**Correct answer:** {sample_g.correct_answer}\n\n")
-                f.write(f"**Got it right:** {', '.join(correct_configs)}\n\n")
-                f.write(f"**Got it wrong:** {', '.join(wrong_configs)}\n")
-                for wlabel in wrong_configs:
-                    g = grades[wlabel]
-                    f.write(f"  - {wlabel}: answered {g.llm_extracted}\n")
-                f.write("\n")
-
-        if disagreement_count == 0:
-            f.write("No disagreements -- all configs agreed on every question.\n\n")
+        if not grades:
+            continue
+
+        correct_configs = [la for la, g in grades.items() if g.is_correct]
+        wrong_configs = [la for la, g in grades.items() if not g.is_correct]
+
+        if correct_configs and wrong_configs:
+            disagreement_count += 1
+            sample_g = list(grades.values())[0]
+            out.write(f"### {qid}\n\n")
+            out.write(f"**Question:** {sample_g.question.text[:200]}\n\n")
+            out.write(f"**Correct answer:** {sample_g.correct_answer}\n\n")
+            out.write(f"**Got it right:** {', '.join(correct_configs)}\n\n")
+            out.write(f"**Got it wrong:** {', '.join(wrong_configs)}\n")
+            for wlabel in wrong_configs:
+                g = grades[wlabel]
+                out.write(f"  - {wlabel}: answered {g.llm_extracted}\n")
+            out.write("\n")
+
+    if disagreement_count == 0:
+        out.write("No disagreements -- all configs agreed on every question.\n\n")
+
+    path.write_text(out.getvalue(), encoding="utf-8")
 
     return str(path)
 
@@ -1030,7 +1480,7 @@ def _write_benchmark_report(
 # Multi-quiz benchmark
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class QuizBenchmarkSummary:
     """Results from benchmarking a single quiz across all configs."""
     quiz_title: str
@@ -1046,12 +1496,17 @@ def run_multi_benchmark(
     n_results: int = 4,
     sections: Optional[Set[str]] = None,
     limit: Optional[int] = None,
+    parallel_configs: int = 1,
+    concurrency: Optional[int] = None,
+    parallel_quizzes: int = 1,
 ) -> str:
     """
     Run benchmarks across multiple quiz files and produce a combined report.
 
     Each quiz is benchmarked independently with per-quiz scores,
     then an aggregate summary ranks configs across all quizzes.
+    parallel_quizzes > 1 benchmarks that many quizzes at once; in-flight
+    LLM calls stay capped at LLM_MAX_IN_FLIGHT overall.
     """
     if configs is None:
         configs = DEFAULT_BENCHMARK_CONFIGS
@@ -1064,78 +1519,83 @@ def run_multi_benchmark(
     print(f"  Configurations: {len(configs)}")
     print(f"{'=' * 60}\n")
 
-    all_summaries: List[QuizBenchmarkSummary] = []
+    sections_label = _sections_label(sections)
 
-    for qi, qpath in enumerate(quiz_paths):
+    def bench_one(
+        qi: int, qpath: str, echo: Callable[..., None] = print
+    ) -> Optional[QuizBenchmarkSummary]:
         path = Path(qpath)
-        print(f"\n{'#' * 60}")
-        print(f"  Quiz {qi + 1}/{total_quizzes}: {path.name}")
-        print(f"{'#' * 60}")
+        echo(f"\n{'#' * 60}")
+        echo(f"  Quiz {qi + 1}/{total_quizzes}: {path.name}")
+        echo(f"{'#' * 60}")
 
         try:
             questions, answer_key, meta = _load_questions(qpath)
         except (FileNotFoundError, ValueError) as e:
-            print(f"  Skipping: {e}")
-            continue
+            echo(f"  Skipping: {e}")
+            return None
 
         title = meta.get("title", path.stem)
-        print(f"  Title: {title}")
-        print(f"  Questions: {len(questions)}")
+        echo(f"  Title: {title}")
+        echo(f"  Questions: {len(questions)}")
 
         questions, answer_key = _apply_filters(
-            questions, answer_key, sections, limit
+            questions, answer_key, sections, limit,
+            sections_label=sections_label, echo=echo,
         )
 
         if not questions:
-            print(f"  Skipping: no questions after filtering")
-            continue
-
-        quiz_results: List[BenchmarkResult] = []
-
-        for ci, cfg in enumerate(configs):
-            print(f"\n  --- Run {ci + 1}/{len(configs)}: {cfg.label} ---")
+            echo(f"  Skipping: no questions after filtering")
+            return None
 
-            run_processor = processor if cfg.use_rag else None
+        quiz_results = _run_configs(
+            configs, questions, answer_key, processor, n_results,
+            parallel_configs, indent="  ", concurrency=concurrency, echo=echo,
+        )
 
-            t0 = time.time()
-            graded = _run_questions(
-                questions, answer_key, run_processor,
-                cfg.mode, cfg.use_rag, n_results, cfg.grounded,
-            )
-            elapsed = time.time() - t0
-
-            total, correct, incorrect, ungraded, accuracy = _score_summary(graded)
-
-            quiz_results.append(BenchmarkResult(
-                label=cfg.label,
-                mode=cfg.mode,
-                use_rag=cfg.use_rag,
-                grounded=cfg.grounded,
-                total=total,
-                correct=correct,
-                incorrect=incorrect,
-                ungraded=ungraded,
-                accuracy=accuracy,
-                elapsed=elapsed,
-                graded=graded,
-            ))
-
-        _print_benchmark_table(quiz_results)
-        all_summaries.append(QuizBenchmarkSummary(
+        _print_benchmark_table(quiz_results, echo=echo)
+        return QuizBenchmarkSummary(
             quiz_title=title,
             quiz_path=qpath,
             results=quiz_results,
-        ))
+        )
+
+    if parallel_quizzes <= 1:
+        summaries = [bench_one(qi, qpath) for qi, qpath in enumerate(quiz_paths)]
+    else:
+        # Each quiz's output is buffered and printed whole when it finishes,
+        # so quizzes running in parallel never interleave on the console
+        print_lock = threading.Lock()
+
+        def bench_buffered(qi: int, qpath: str) -> Optional[QuizBenchmarkSummary]:
+            out = _OutputBuffer()
+            try:
+                return bench_one(qi, qpath, out.print)
+            finally:
+                with print_lock:
+                    print(out.getvalue(), end="", flush=True)
+
+        with ThreadPoolExecutor(max_workers=parallel_quizzes) as pool:
+            # map() keeps summaries in quiz_paths order
+            summaries = list(pool.map(bench_buffered, range(total_quizzes), quiz_paths))
+
+    all_summaries = [summary for summary in summaries if summary is not None]
 
     if not all_summaries:
         print("No quizzes were successfully benchmarked.")
         return output_path
 
+    # Aggregate once for both the report and the console table
+    agg = _aggregate_by_config(all_summaries)
+
     # Write combined report
-    report_path = _write_multi_benchmark_report(all_summaries, output_path)
+    report_path = _write_multi_benchmark_report(
+        all_summaries, output_path, agg,
+        timing_note=_timing_note(concurrency, parallel_configs),
+    )
 
     # Print aggregate table
-    _print_aggregate_table(all_summaries)
+    _print_aggregate_table(all_summaries, agg)
 
     return report_path
 
@@ -1172,12 +1632,16 @@ def _aggregate_by_config(
     return agg
 
 
-def _print_aggregate_table(summaries: List[QuizBenchmarkSummary]) -> None:
-    """Print aggregate results across all quizzes."""
+def _print_aggregate_table(
+    summaries: List[QuizBenchmarkSummary],
+    agg: Optional[Dict[str, Dict]] = None,
+) -> None:
+    """Print aggregate results across all quizzes (agg: precomputed aggregate)."""
     if not summaries:
         return
 
-    agg = _aggregate_by_config(summaries)
+    if agg is None:
+        agg = _aggregate_by_config(summaries)
     ranked = sorted(agg.items(), key=lambda kv: kv[1]["accuracy"], reverse=True)
 
     quiz_titles = [s.quiz_title for s in summaries]
@@ -1185,118 +1649,95 @@ def _print_aggregate_table(summaries: List[QuizBenchmarkSummary]) -> None:
     print(f"\n{'=' * 80}")
     print(f"  AGGREGATE RESULTS ({len(summaries)} quizzes)")
     print(f"{'=' * 80}")
-    print(f"  {'Config':<35s} {'Overall':>8s}", end="")
-    for title in quiz_titles:
-        short = title[:12]
-        print(f" {short:>12s}", end="")
-    print(f" {'Time':>8s}")
-    print(f"  {'-' * 35} {'-' * 8}", end="")
-    for _ in quiz_titles:
-        print(f" {'-' * 12}", end="")
-    print(f" {'-' * 8}")
+    # Each line is assembled first and printed with a single call
+    print(
+        f"  {'Config':<35s} {'Overall':>8s}"
+        + "".join(f" {title[:12]:>12s}" for title in quiz_titles)
+        + f" {'Time':>8s}"
+    )
+    print(f"  {'-' * 35} {'-' * 8}" + f" {'-' * 12}" * len(quiz_titles) + f" {'-' * 8}")
 
     for label, a in ranked:
         print(
             f"  {label:<35s} "
-            f"{a['accuracy'] * 100:5.1f}%  ",
-            end="",
+            f"{a['accuracy'] * 100:5.1f}%  "
+            + "".join(f" {acc * 100:10.1f}%" for _, acc in a["quiz_accuracies"])
+            + f" {a['elapsed']:>7.0f}s"
         )
-        for _, acc in a["quiz_accuracies"]:
-            print(f" {acc * 100:10.1f}%", end="")
-        print(f" {a['elapsed']:>7.0f}s")
 
     print(f"{'=' * 80}\n")
 
 
+def _format_quiz_section(number: int, summary: QuizBenchmarkSummary) -> str:
+    """One quiz's section of the multi-quiz report: summary + breakdown."""
+    ranked = sorted(summary.results, key=lambda r: r.accuracy, reverse=True)
+
+    parts = [
+        f"## Quiz {number}: {summary.quiz_title}\n\n",
+        "| Rank | Config | Accuracy | Correct | Time | Per-Q |\n",
+        "|------|--------|----------|---------|------|-------|\n",
+    ]
+    parts.extend(_summary_rows(ranked))
+    parts.append("\n")
+
+    if summary.results and summary.results[0].graded:
+        all_qids = [g.question.id for g in summary.results[0].graded]
+        ranked_indexes = [_index_by_qid(r.graded) for r in ranked]
+        parts.append(_format_breakdown_table(all_qids, ranked, ranked_indexes))
+
+    parts.append("\n---\n\n")
+    return "".join(parts)
+
+
 def _write_multi_benchmark_report(
     summaries: List[QuizBenchmarkSummary],
     output_path: str,
+    agg: Optional[Dict[str, Dict]] = None,
+    timing_note: str = "",
 ) -> str:
-    """Write a combined benchmark report with per-quiz and aggregate sections."""
+    """
+    Write a combined benchmark report with per-quiz and aggregate sections.
+
+    Pass agg to reuse an aggregate already computed by _aggregate_by_config.
+    """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    agg = _aggregate_by_config(summaries)
+    if agg is None:
+        agg = _aggregate_by_config(summaries)
     ranked_labels = sorted(agg.items(), key=lambda kv: kv[1]["accuracy"], reverse=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("# Multi-Quiz Benchmark Report\n\n")
-        f.write(f"**Quizzes:** {len(summaries)}\n\n")
-        for s in summaries:
-            f.write(f"- {s.quiz_title}\n")
-        f.write("\n---\n\n")
-
-        # Aggregate summary
-        f.write("## Aggregate Summary\n\n")
-        f.write("| Rank | Config | Overall |")
-        for s in summaries:
-            f.write(f" {s.quiz_title[:25]} |")
-        f.write(" Total Time |\n")
-        f.write("|------|--------|---------|")
-        for _ in summaries:
-            f.write("------|")
-        f.write("------|\n")
-
-        for rank, (label, a) in enumerate(ranked_labels, 1):
-            f.write(f"| {rank} | {label} | {a['accuracy'] * 100:.1f}% |")
-            for _, acc in a["quiz_accuracies"]:
-                f.write(f" {acc * 100:.1f}% |")
-            f.write(f" {a['elapsed']:.0f}s |\n")
-
-        f.write("\n---\n\n")
-
-        # Per-quiz detail sections
-        for si, summary in enumerate(summaries):
-            f.write(f"## Quiz {si + 1}: {summary.quiz_title}\n\n")
-
-            ranked_results = sorted(
-                summary.results, key=lambda r: r.accuracy, reverse=True
-            )
+    # Assemble the report in memory and write it with one call
+    out = io.StringIO()
+    out.write("# Multi-Quiz Benchmark Report\n\n")
+    out.write(f"**Quizzes:** {len(summaries)}\n\n")
+    out.write(timing_note)
+    for s in summaries:
+        out.write(f"- {s.quiz_title}\n")
+    out.write("\n---\n\n")
+
+    # Aggregate summary
+    out.write("## Aggregate Summary\n\n")
+    out.write(_md_row(
+        ["Rank", "Config", "Overall"]
+        + [s.quiz_title[:25] for s in summaries]
+        + ["Total Time"]
+    ))
+    out.write("|------|--------|---------|" + "------|" * len(summaries) + "------|\n")
+
+    for rank, (label, a) in enumerate(ranked_labels, 1):
+        out.write(_md_row(
+            [str(rank), label, f"{a['accuracy'] * 100:.1f}%"]
+            + [f"{acc * 100:.1f}%" for _, acc in a["quiz_accuracies"]]
+            + [f"{a['elapsed']:.0f}s"]
+        ))
 
-            f.write("| Rank | Config | Accuracy | Correct | Time | Per-Q |\n")
-            f.write("|------|--------|----------|---------|------|-------|\n")
-
-            for rank, r in enumerate(ranked_results, 1):
-                gradable = r.total - r.ungraded
-                per_q = r.elapsed / r.total if r.total > 0 else 0
-                f.write(
-                    f"| {rank} | {r.label} | "
-                    f"{r.accuracy * 100:.1f}% | "
-                    f"{r.correct}/{gradable} | "
-                    f"{r.elapsed:.1f}s | "
-                    f"{per_q:.1f}s |\n"
-                )
+    out.write("\n---\n\n")
+
+    # Per-quiz detail sections
+    for si, summary in enumerate(summaries):
+        out.write(_format_quiz_section(si + 1, summary))
 
-            f.write("\n")
-
-            # Per-question breakdown
-            if summary.results and summary.results[0].graded:
-                all_qids = [g.question.id for g in summary.results[0].graded]
-
-                f.write("| Question |")
-                for r in ranked_results:
-                    f.write(f" {r.label} |")
-                f.write("\n|----------|")
-                for _ in ranked_results:
-                    f.write("------|")
-                f.write("\n")
-
-                for qid in all_qids:
-                    f.write(f"| {qid} |")
-                    for r in ranked_results:
-                        g = next(
-                            (g for g in r.graded if g.question.id == qid), None
-                        )
-                        if g is None:
-                            f.write(" - |")
-                        elif g.is_correct is None:
-                            f.write(" ? |")
-                        elif g.is_correct:
-                            f.write(" + |")
-                        else:
-                            f.write(f" x ({g.llm_extracted}) |")
-                    f.write("\n")
-
-            f.write("\n---\n\n")
+    path.write_text(out.getvalue(), encoding="utf-8")
 
     return str(path)
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Response cache — content-addressed on-disk store for LLM responses.
+
+Benchmark sweeps and reruns resend identical (model, options, prompt)
+combinations; a cache hit turns seconds of inference into a file read.
+Entries live under LLM_CACHE_DIR as <key[:2]>/<key>, one file per response.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from backend.config import LLM_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(model: str, options: dict, prompt: str) -> str:
+    """Hash everything that affects the generated text."""
+    payload = f"{model}\0{json.dumps(options, sort_keys=True)}\0{prompt}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _path_for(key: str) -> Path:
+    return LLM_CACHE_DIR / key[:2] / key
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached response for key, or None on a miss."""
+    try:
+        return _path_for(key).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Error reading response cache entry {key}: {e}")
+        return None
+
+
+def put(key: str, response: str) -> None:
+    """
+    Store a response. Writes go through a temp file + rename so concurrent
+    workers never observe a partially written entry.
+    """
+    path = _path_for(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(response)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Error writing response cache entry {key}: {e}")
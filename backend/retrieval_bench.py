@@ -12,15 +12,24 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+from backend import response_cache
 from backend.document_processor import DocumentProcessor, OllamaConnectionError
-from backend.config import CHAT_MODELS, CHAT_OPTIONS
+from backend.config import (
+    CHAT_MODELS,
+    CHAT_OPTIONS,
+    LLM_CACHE_ENABLED,
+    VALID_MODES_LIST,
+    VALID_MODES_SET,
+)
+from backend.json_io import read_json
 
 
 # ---------------------------------------------------------------------------
@@ -36,6 +45,8 @@ class RetrievalResult:
     retrieved_sources: List[str]        # source filenames from top-N
     retrieved_breadcrumbs: List[str]    # full breadcrumb labels
     source_hit: bool                    # did any expected source appear?
+    retrieved_ids: List[str] = field(default_factory=list)       # chunk ids, in rank order
+    query_results: Dict = field(default_factory=dict, repr=False)  # raw results, reused as LLM context
     llm_responses: Dict[str, str] = field(default_factory=dict)  # mode -> response
     elapsed: Dict[str, float] = field(default_factory=dict)      # mode -> seconds
 
@@ -44,6 +55,126 @@ class RetrievalResult:
 # Core logic
 # ---------------------------------------------------------------------------
 
+def _process_question(
+    processor: DocumentProcessor,
+    question: str,
+    category: str,
+    expected: List[str],
+    expected_lc: List[str],
+    mixed: bool,
+    n_results: int,
+    embedding: Optional[List[float]] = None,
+) -> RetrievalResult:
+    """
+    Retrieve the top chunks for one question and check for a source hit.
+
+    `expected_lc` is the lowercased `expected` list and `mixed` marks a
+    cross-cutting category; both are computed once per category.
+
+    With a precomputed embedding the question is not re-embedded.
+    """
+    if embedding is not None:
+        query_results = processor.query_by_vector(embedding, n_results=n_results)
+    else:
+        query_results = processor.query(question, n_results=n_results)
+
+    sources = []
+    breadcrumbs = []
+    for meta in query_results["metadatas"][0]:
+        src = meta.get("source", "unknown")
+        bc = meta.get("breadcrumb", "")
+        heading = meta.get("heading", "")
+        page = meta.get("page", "")
+
+        if bc:
+            label = f"{src} > {bc}"
+        elif heading:
+            label = f"{src} > {heading}"
+        elif page:
+            label = f"{src}, page {page}"
+        else:
+            label = src
+
+        sources.append(src)
+        breadcrumbs.append(label)
+
+    # Check if any expected source appears in retrieved sources
+    # (cross-cutting questions don't have strict source expectations)
+    hit = mixed or any(
+        exp in src_lc
+        for src_lc in [src.lower() for src in sources]
+        for exp in expected_lc
+    )
+
+    return RetrievalResult(
+        question=question,
+        category=category,
+        expected_sources=expected,
+        retrieved_sources=sources,
+        retrieved_breadcrumbs=breadcrumbs,
+        source_hit=hit,
+        retrieved_ids=query_results["ids"][0],
+        query_results=query_results,
+    )
+
+
+def _generate_response(
+    processor: DocumentProcessor,
+    question: str,
+    mode: str,
+    n_results: int,
+    query_results: Dict,
+    cache_key: Optional[str] = None,
+) -> Tuple[str, float]:
+    """
+    Drain one ask_question stream; returns (response, elapsed seconds).
+
+    The answer is generated from `query_results`, the retrieval already
+    scored for this question, so the context always matches the chunk ids
+    the cache key was built from.
+
+    With a cache_key, a cached response is returned with elapsed 0.0 and a
+    freshly generated one is stored (errors are never cached).
+    """
+    if cache_key is not None:
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return cached, 0.0
+
+    t0 = time.perf_counter()
+
+    parts: List[str] = []
+    try:
+        # Responses are cached here, keyed on the retrieved chunk ids
+        for token in processor.ask_question(
+            question, mode=mode, n_results=n_results, use_cache=False,
+            results=query_results,
+        ):
+            parts.append(token)
+        full_response = "".join(parts)
+    except Exception as e:
+        return f"[error: {e}]", time.perf_counter() - t0
+
+    elapsed = time.perf_counter() - t0
+    if cache_key is not None:
+        response_cache.put(cache_key, full_response)
+    return full_response, elapsed
+
+
+def _response_cache_key(
+    mode: str, question: str, n_results: int, chunk_ids: List[str]
+) -> str:
+    """Key a bench response on the model, its options, and the exact context."""
+    options = {
+        **CHAT_OPTIONS.get(mode, CHAT_OPTIONS["qwen-7b"]),
+        "n_results": n_results,
+        "chunk_ids": chunk_ids,
+    }
+    return response_cache.make_key(
+        CHAT_MODELS.get(mode, CHAT_MODELS["qwen-7b"]), options, question
+    )
+
+
 def run_retrieval_bench(
     test_path: str,
     processor: DocumentProcessor,
@@ -51,96 +182,99 @@ def run_retrieval_bench(
     modes: Optional[List[str]] = None,
     retrieval_only: bool = False,
     category_filter: Optional[str] = None,
+    concurrency: int = 8,
+    use_cache: Optional[bool] = None,
+    parallel_modes: bool = False,
 ) -> List[RetrievalResult]:
-    """Run the retrieval benchmark and optionally collect LLM responses."""
-
-    with open(test_path, "r") as f:
-        data = json.load(f)
-
-    tests = data.get("retrieval_tests", [])
+    """
+    Run the retrieval benchmark and optionally collect LLM responses.
+
+    All questions are embedded up front in one batched request. Retrieval
+    for each category then runs up to `concurrency` questions at once.
+    LLM responses are generated one question at a time, from the chunks
+    retrieved above. With parallel_modes, all requested modes for a
+    question run at once; faster, but each model's timing then includes
+    contention with the others, so it is off by default.
+
+    With use_cache (default LLM_CACHE_ENABLED), LLM responses are reused
+    from the on-disk response cache when the mode, question and retrieved
+    chunk ids all match a previous run.
+    """
+    if use_cache is None:
+        use_cache = LLM_CACHE_ENABLED
+
+    data = read_json(test_path)
+
+    tests = [
+        group for group in data.get("retrieval_tests", [])
+        if not category_filter or group["category"] == category_filter
+    ]
     results: List[RetrievalResult] = []
 
-    for group in tests:
-        cat = group["category"]
-        if category_filter and cat != category_filter:
-            continue
-
-        expected = group.get("expected_sources", [])
-        questions = group["questions"]
-
-        print(f"\n{'=' * 60}")
-        print(f"  Category: {cat} ({len(questions)} questions)")
-        print(f"  Expected sources: {expected}")
-        print(f"{'=' * 60}")
-
-        for qi, question in enumerate(questions):
-            print(f"\n  [{qi + 1}/{len(questions)}] {question}")
-
-            # -- Retrieval --
-            query_results = processor.query(question, n_results=n_results)
-
-            sources = []
-            breadcrumbs = []
-            for meta in query_results["metadatas"][0]:
-                src = meta.get("source", "unknown")
-                bc = meta.get("breadcrumb", "")
-                heading = meta.get("heading", "")
-                page = meta.get("page", "")
-
-                if bc:
-                    label = f"{src} > {bc}"
-                elif heading:
-                    label = f"{src} > {heading}"
-                elif page:
-                    label = f"{src}, page {page}"
-                else:
-                    label = src
-
-                sources.append(src)
-                breadcrumbs.append(label)
-
-            # Check if any expected source appears in retrieved sources
-            if expected == ["mixed"]:
-                hit = True  # cross-cutting questions don't have strict source expectations
-            else:
-                hit = any(
-                    any(exp.lower() in src.lower() for exp in expected)
-                    for src in sources
-                )
-
-            icon = "+" if hit else "x"
-            print(f"    Retrieval [{icon}]: {sources[:4]}...")
-
-            result = RetrievalResult(
-                question=question,
-                category=cat,
-                expected_sources=expected,
-                retrieved_sources=sources,
-                retrieved_breadcrumbs=breadcrumbs,
-                source_hit=hit,
-            )
-
-            # -- LLM responses --
-            if not retrieval_only and modes:
-                for mode in modes:
-                    print(f"    Generating response ({mode})...", end=" ", flush=True)
-                    t0 = time.time()
-
-                    full_response = ""
-                    try:
-                        for token in processor.ask_question(
-                            question, mode=mode, n_results=n_results
-                        ):
-                            full_response += token
-                    except Exception as e:
-                        full_response = f"[error: {e}]"
-
-                    elapsed = time.time() - t0
-                    result.llm_responses[mode] = full_response
-                    result.elapsed[mode] = elapsed
-                    print(f"({elapsed:.1f}s)")
-
-            results.append(result)
+    all_questions = list(dict.fromkeys(
+        question for group in tests for question in group["questions"]
+    ))
+    embeddings = dict(zip(all_questions, processor.embed_texts(all_questions)))
+
+    # Different models load side by side in Ollama, so with parallel_modes
+    # the modes for one question are generated concurrently.
+    generate = bool(modes) and not retrieval_only
+    pool_cm = (
+        ThreadPoolExecutor(max_workers=len(modes))
+        if generate and parallel_modes else nullcontext()
+    )
+
+    with pool_cm as mode_pool:
+        for group in tests:
+            cat = group["category"]
+            expected = group.get("expected_sources", [])
+            expected_lc = [exp.lower() for exp in expected]
+            mixed = expected == ["mixed"]
+            questions = group["questions"]
+
+            print(f"\n{'=' * 60}")
+            print(f"  Category: {cat} ({len(questions)} questions)")
+            print(f"  Expected sources: {expected}")
+            print(f"{'=' * 60}")
+
+            # -- Retrieval (concurrent; results come back in question order) --
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+                retrieved = list(pool.map(
+                    lambda question: _process_question(
+                        processor, question, cat, expected, expected_lc, mixed,
+                        n_results,
+                        embedding=embeddings[question],
+                    ),
+                    questions,
+                ))
+
+            for qi, (question, result) in enumerate(zip(questions, retrieved)):
+                print(f"\n  [{qi + 1}/{len(questions)}] {question}")
+
+                icon = "+" if result.source_hit else "x"
+                print(f"    Retrieval [{icon}]: {result.retrieved_sources[:4]}...")
+
+                # -- LLM responses (printed in mode order) --
+                if generate:
+                    def respond(mode: str) -> Tuple[str, float]:
+                        return _generate_response(
+                            processor, question, mode, n_results,
+                            result.query_results,
+                            cache_key=_response_cache_key(
+                                mode, question, n_results, result.retrieved_ids
+                            ) if use_cache else None,
+                        )
+
+                    generated = (
+                        mode_pool.map(respond, modes) if mode_pool is not None
+                        else map(respond, modes)
+                    )
+                    for mode, (full_response, elapsed) in zip(modes, generated):
+                        result.llm_responses[mode] = full_response
+                        result.elapsed[mode] = elapsed
+                        print(f"    Generating response ({mode})... ({elapsed:.1f}s)")
+
+                results.append(result)
 
     return results
 
@@ -155,6 +289,7 @@ def write_report(
     modes: List[str],
     n_results: int,
     retrieval_only: bool,
+    parallel_modes: bool = False,
 ) -> str:
     """Write a markdown report with retrieval stats and LLM responses."""
 
@@ -167,65 +302,68 @@ def write_report(
     total = len(results)
     total_hits = sum(1 for r in results if r.source_hit)
 
-    lines = []
-    lines.append("# Retrieval Benchmark Report\n")
-    lines.append(f"**n_results:** {n_results}  ")
-    lines.append(f"**Total questions:** {total}  ")
-    lines.append(f"**Retrieval hit rate:** {total_hits}/{total} "
-                 f"({total_hits / total * 100:.0f}%)\n")
-
-    if modes and not retrieval_only:
-        lines.append(f"**Models tested:** {', '.join(modes)}\n")
-
-    # -- Summary table --
-    lines.append("## Summary by Category\n")
-    lines.append("| Category | Questions | Hits | Hit Rate |")
-    lines.append("|----------|-----------|------|----------|")
-    for cat, cat_results in categories.items():
-        cat_total = len(cat_results)
-        cat_hits = sum(1 for r in cat_results if r.source_hit)
-        pct = cat_hits / cat_total * 100 if cat_total > 0 else 0
-        lines.append(f"| {cat} | {cat_total} | {cat_hits} | {pct:.0f}% |")
-    lines.append("")
-
-    # -- Retrieval misses --
-    misses = [r for r in results if not r.source_hit]
-    if misses:
-        lines.append("## Retrieval Misses\n")
-        lines.append("Questions where expected sources did not appear in top results:\n")
-        for r in misses:
-            lines.append(f"**Q:** {r.question}  ")
-            lines.append(f"**Expected:** {r.expected_sources}  ")
-            lines.append(f"**Got:** {r.retrieved_sources[:5]}  ")
-            lines.append("")
-
-    # -- Per-question detail --
-    lines.append("## Per-Question Detail\n")
-
-    for cat, cat_results in categories.items():
-        lines.append(f"### {cat}\n")
-
-        for r in cat_results:
-            icon = "PASS" if r.source_hit else "MISS"
-            lines.append(f"#### [{icon}] {r.question}\n")
-            lines.append("**Retrieved sources:**\n")
-            for i, bc in enumerate(r.retrieved_breadcrumbs):
-                lines.append(f"  [{i + 1}] {bc}  ")
-            lines.append("")
-
-            # LLM responses
-            if r.llm_responses:
-                for mode, response in r.llm_responses.items():
-                    elapsed = r.elapsed.get(mode, 0)
-                    lines.append(f"**{mode}** ({elapsed:.1f}s):\n")
-                    lines.append(f"{response}\n")
-                    lines.append("")
-
-        lines.append("---\n")
-
-    report = "\n".join(lines)
-    with open(output_path, "w") as f:
-        f.write(report)
+    # Written straight to a buffered file so large reports (full LLM
+    # responses per question) are never held in memory twice.
+    with open(output_path, "w", buffering=1 << 20) as f:
+        w = f.write
+        w("# Retrieval Benchmark Report\n\n")
+        w(f"**n_results:** {n_results}  \n")
+        w(f"**Total questions:** {total}  \n")
+        w(f"**Retrieval hit rate:** {total_hits}/{total} "
+          f"({total_hits / total * 100:.0f}%)\n\n")
+
+        if modes and not retrieval_only:
+            w(f"**Models tested:** {', '.join(modes)}\n\n")
+            if parallel_modes and len(modes) > 1:
+                w("**Timing:** models were run concurrently; per-model times "
+                  "include contention and are not comparable with sequential "
+                  "runs.\n\n")
+
+        # -- Summary table --
+        w("## Summary by Category\n\n")
+        w("| Category | Questions | Hits | Hit Rate |\n")
+        w("|----------|-----------|------|----------|\n")
+        for cat, cat_results in categories.items():
+            cat_total = len(cat_results)
+            cat_hits = sum(1 for r in cat_results if r.source_hit)
+            pct = cat_hits / cat_total * 100 if cat_total > 0 else 0
+            w(f"| {cat} | {cat_total} | {cat_hits} | {pct:.0f}% |\n")
+        w("\n")
+
+        # -- Retrieval misses --
+        misses = [r for r in results if not r.source_hit]
+        if misses:
+            w("## Retrieval Misses\n\n")
+            w("Questions where expected sources did not appear in top results:\n\n")
+            for r in misses:
+                w(f"**Q:** {r.question}  \n")
+                w(f"**Expected:** {r.expected_sources}  \n")
+                w(f"**Got:** {r.retrieved_sources[:5]}  \n")
+                w("\n")
+
+        # -- Per-question detail --
+        w("## Per-Question Detail\n\n")
+
+        for cat, cat_results in categories.items():
+            w(f"### {cat}\n\n")
+
+            for r in cat_results:
+                icon = "PASS" if r.source_hit else "MISS"
+                w(f"#### [{icon}] {r.question}\n\n")
+                w("**Retrieved sources:**\n\n")
+                for i, bc in enumerate(r.retrieved_breadcrumbs):
+                    w(f"  [{i + 1}] {bc}  \n")
+                w("\n")
+
+                # LLM responses
+                if r.llm_responses:
+                    for mode, response in r.llm_responses.items():
+                        elapsed = r.elapsed.get(mode, 0)
+                        w(f"**{mode}** ({elapsed:.1f}s):\n\n")
+                        w(f"{response}\n\n")
+                        w("\n")
+
+            w("---\n\n")
 
     return output_path
 
@@ -257,6 +395,14 @@ Examples:
                         help="Only test retrieval, skip LLM responses")
     parser.add_argument("--category", "-c", default=None,
                         help="Only run a specific category (typescript, vitest_api, rtl, cross_cutting)")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="Retrieval queries in flight at once (default: 8)")
+    parser.add_argument("--parallel-modes", action="store_true",
+                        help="Generate all --modes for a question at once "
+                             "(faster; per-model times then include contention)")
+    parser.add_argument("--cache", action="store_true", default=LLM_CACHE_ENABLED,
+                        help="Reuse cached LLM responses for unchanged questions "
+                             "and context (default: COSMO_CACHE)")
 
     args = parser.parse_args()
 
@@ -274,11 +420,11 @@ Examples:
     modes = [m.strip() for m in args.modes.split(",")] if not args.retrieval_only else []
 
     # Validate modes
-    for mode in modes:
-        if mode not in CHAT_MODELS:
-            print(f"Error: Unknown mode '{mode}'. Valid: {', '.join(CHAT_MODELS.keys())}",
-                  file=sys.stderr)
-            return 1
+    bad = [mode for mode in modes if mode not in VALID_MODES_SET]
+    if bad:
+        print(f"Error: Unknown mode(s) {', '.join(bad)}. Valid: {VALID_MODES_LIST}",
+              file=sys.stderr)
+        return 1
 
     output_path = args.output or f"results/{input_path.stem}-retrieval.md"
 
@@ -302,10 +448,14 @@ Examples:
         modes=modes,
         retrieval_only=args.retrieval_only,
         category_filter=args.category,
+        concurrency=args.concurrency,
+        use_cache=args.cache,
+        parallel_modes=args.parallel_modes,
     )
 
     report_path = write_report(
         results, output_path, modes, args.results, args.retrieval_only,
+        parallel_modes=args.parallel_modes,
     )
 
     # Print summary
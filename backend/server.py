@@ -7,8 +7,12 @@ Run with:  python -m backend.server   (from project root)
 import json
 import logging
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator, Tuple
 
+import ollama
 from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 from pathlib import Path
@@ -25,16 +29,21 @@ from backend.config import (
     EMBED_MODEL,
     EMBEDDING_BATCH_SIZE,
     DECK_DIR,
+    EVAL_CONCURRENCY,
+    EVAL_MAX_BATCH,
+    EVAL_OPTIONS,
     SERVER_HOST,
     SERVER_PORT,
     UPLOAD_DIR,
-    VALID_MODES,
+    VALID_MODES_SET,
 )
 from backend.document_processor import (
     ChatHistory,
     DocumentProcessor,
     OllamaConnectionError,
+    iter_document_files,
 )
+from backend.json_io import dumps_bytes, loads, read_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,6 +57,9 @@ CORS(app)
 
 _processor: DocumentProcessor | None = None
 _history = ChatHistory(max_turns=DEFAULT_HISTORY_TURNS)
+_quiz_cache: dict[Path, tuple[int, dict]] = {}  # path -> (mtime_ns, parsed JSON)
+# (deck signature it was built from, quiz id -> quiz); swapped as one tuple
+_quiz_index: tuple[tuple, dict[str, dict]] = ((), {})
 
 UPLOAD_DIR.mkdir(exist_ok=True)
 DECK_DIR.mkdir(exist_ok=True)
@@ -76,6 +88,65 @@ def _iter_deck_files() -> Generator[Tuple[Path, str], None, None]:
                 yield fp, subdir.name
 
 
+def _load_quiz(fp: Path) -> dict:
+    """
+    Parse a deck file, reusing the cached result while its mtime is unchanged.
+
+    The returned dict is shared between requests; copy it before mutating.
+    """
+    mtime = fp.stat().st_mtime_ns
+    cached = _quiz_cache.get(fp)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = read_json(fp)
+    _quiz_cache[fp] = (mtime, data)
+    return data
+
+
+def _deck_signature() -> tuple:
+    """(path, mtime_ns, size) for every deck file, in _iter_deck_files order."""
+    sig = []
+    for fp, _module in _iter_deck_files():
+        try:
+            st = fp.stat()
+        except OSError:
+            continue
+        sig.append((fp, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _rebuild_quiz_index(sig: tuple | None = None) -> dict[str, dict]:
+    """Map every quiz id in DECK_DIR to the first deck file that defines it."""
+    global _quiz_index
+    if sig is None:
+        sig = _deck_signature()
+    index: dict[str, dict] = {}
+    for fp, _mtime, _size in sig:
+        try:
+            for quiz in _load_quiz(fp).get("quizzes", []):
+                if "id" in quiz:
+                    index.setdefault(quiz["id"], quiz)
+        except Exception as e:
+            logger.warning(f"Error reading quiz file {fp.name}: {e}")
+    # Swap in the finished index so concurrent lookups never see it half-built
+    _quiz_index = (sig, index)
+    return index
+
+
+def _lookup_quiz(quiz_id: str) -> dict | None:
+    """
+    Find a quiz by id. The index is rebuilt whenever any deck file was
+    added, removed or rewritten, so hits, misses and first-file-wins
+    precedence all match a fresh scan; an unchanged tree costs one stat
+    per deck file and no parsing.
+    """
+    sig = _deck_signature()
+    built_from, index = _quiz_index
+    if sig != built_from:
+        index = _rebuild_quiz_index(sig)
+    return index.get(quiz_id)
+
+
 # ===================================================================
 # Health / status
 # ===================================================================
@@ -111,6 +182,17 @@ def stats():
 # Chat — streaming via Server-Sent Events
 # ===================================================================
 
+# Pre-encoded SSE framing; each event is prefix + JSON bytes + suffix.
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# Tokens are coalesced into one event once this many are buffered, or as
+# soon as a token arrives more than this long after the previous event.
+_SSE_BATCH_TOKENS = 4
+_SSE_BATCH_SECONDS = 0.005
+
+
 @app.route("/api/chat", methods=["POST"])
 def chat():
     data = request.get_json(silent=True) or {}
@@ -121,23 +203,32 @@ def chat():
 
     if not question:
         return jsonify({"error": "question is required"}), 400
-    if mode not in VALID_MODES:
+    if mode not in VALID_MODES_SET:
         return jsonify({"error": f"invalid mode: {mode}"}), 400
 
     def generate():
         try:
             proc = get_processor()
+            buf = []
+            last = time.perf_counter()
             for token in proc.ask_question(
                 question, mode=mode, n_results=n_results, history=_history,
                 grounded=grounded,
             ):
-                yield f"data: {json.dumps({'token': token})}\n\n"
-            yield "data: [DONE]\n\n"
+                buf.append(token)
+                now = time.perf_counter()
+                if len(buf) >= _SSE_BATCH_TOKENS or now - last > _SSE_BATCH_SECONDS:
+                    yield _SSE_PREFIX + dumps_bytes({"token": "".join(buf)}) + _SSE_SUFFIX
+                    buf.clear()
+                    last = now
+            if buf:
+                yield _SSE_PREFIX + dumps_bytes({"token": "".join(buf)}) + _SSE_SUFFIX
+            yield _SSE_DONE
         except OllamaConnectionError as e:
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield _SSE_PREFIX + dumps_bytes({"error": str(e)}) + _SSE_SUFFIX
         except Exception as e:
             logger.exception("Error during chat stream")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield _SSE_PREFIX + dumps_bytes({"error": str(e)}) + _SSE_SUFFIX
 
     return Response(
         stream_with_context(generate()),
@@ -207,21 +298,15 @@ def ingest_directory():
     if not p.exists() or not p.is_dir():
         return jsonify({"error": f"Directory not found: {dir_path}"}), 404
 
-    results = []
     try:
         proc = get_processor()
-        for ext_glob in ("**/*.pdf", "**/*.md", "**/*.markdown"):
-            for filepath in p.glob(ext_glob):
-                try:
-                    ext = filepath.suffix.lower()
-                    count = (
-                        proc.ingest_pdf(str(filepath), force=force)
-                        if ext == ".pdf"
-                        else proc.ingest_markdown(str(filepath), force=force)
-                    )
-                    results.append({"file": filepath.name, "chunks": count})
-                except Exception as e:
-                    results.append({"file": filepath.name, "error": str(e)})
+        # Same order as `cli ingest --dir`: PDFs first, then markdown, each sorted
+        files = sorted(
+            iter_document_files(p),
+            key=lambda fp: (fp.suffix.lower() != ".pdf", fp),
+        )
+
+        results = proc.ingest_files(files, force=force)
         return jsonify({"status": "ok", "files": results})
     except OllamaConnectionError as e:
         return jsonify({"error": str(e)}), 503
@@ -260,8 +345,7 @@ def list_quizzes():
     results = []
     for fp, module in _iter_deck_files():
         try:
-            with open(fp) as f:
-                data = json.load(f)
+            data = _load_quiz(fp)
             for quiz in data.get("quizzes", []):
                 total_q = sum(
                     len(s.get("questions", []))
@@ -286,15 +370,9 @@ def list_quizzes():
 
 @app.route("/api/quizzes/<quiz_id>", methods=["GET"])
 def get_quiz(quiz_id: str):
-    for fp, _module in _iter_deck_files():
-        try:
-            with open(fp) as f:
-                data = json.load(f)
-            for quiz in data.get("quizzes", []):
-                if quiz.get("id") == quiz_id:
-                    return jsonify(quiz)
-        except Exception:
-            continue
+    quiz = _lookup_quiz(quiz_id)
+    if quiz is not None:
+        return jsonify(quiz)
     return jsonify({"error": f"Quiz '{quiz_id}' not found"}), 404
 
 
@@ -342,10 +420,11 @@ def ingest_quiz():
         import shutil
         shutil.copy2(str(src_path), str(dest))
 
+    _quiz_cache.pop(dest, None)
+
     # Validate
     try:
-        with open(dest) as f:
-            data = json.load(f)
+        data = read_json(dest)
     except json.JSONDecodeError as e:
         dest.unlink(missing_ok=True)
         return jsonify({"error": f"Invalid JSON: {e}"}), 400
@@ -355,6 +434,8 @@ def ingest_quiz():
         dest.unlink(missing_ok=True)
         return jsonify({"error": err}), 400
 
+    _rebuild_quiz_index()
+
     quiz_ids = [q.get("id", "?") for q in data.get("quizzes", [])]
     total_q = sum(
         len(s.get("questions", []))
@@ -371,6 +452,76 @@ def ingest_quiz():
     })
 
 
+# Grader replies: an optional ```-fence around the JSON, and (when the JSON
+# doesn't parse) the first "incorrect" — or failing that any "correct" —
+# decides the score.
+_FENCE_RE = re.compile(r"\A```[^\n]*\n|```\Z")
+_VERDICT_RE = re.compile(r"(in)?correct", re.IGNORECASE)
+
+
+def _eval_doc_block(results: dict) -> str:
+    """Format up to two retrieved chunks as the grader's documentation block."""
+    if not results["documents"][0]:
+        return ""
+    return (
+        "\n\nRelevant documentation:\n"
+        + "\n".join(results["documents"][0][:2])
+    )
+
+
+def _grade_answer(
+    proc: DocumentProcessor,
+    question: str,
+    user_answer: str,
+    model_answer: str,
+    mode: str,
+    doc_block: str,
+) -> dict:
+    """Ask the LLM to grade one answer; returns {"score", "feedback"}."""
+    prompt = (
+        f"You are grading a technical quiz answer.\n\n"
+        f"Question:\n{question}\n\n"
+        f"Model answer (reference):\n{model_answer}\n\n"
+        f"Student's answer:\n{user_answer}\n"
+        f"{doc_block}\n"
+        "Evaluate the student's answer. Consider:\n"
+        "1. Does it capture the key concepts from the model answer?\n"
+        "2. Is it technically accurate based on the documentation?\n"
+        "3. Are there any misconceptions or missing critical points?\n\n"
+        'Respond in EXACTLY this JSON format and nothing else:\n'
+        '{"score": "<correct|partial|incorrect>", "feedback": "<1-3 sentence explanation>"}'
+    )
+
+    llm_model = proc.models.get(mode, proc.models["qwen-7b"])
+
+    response = ollama.chat(
+        model=llm_model,
+        messages=[{"role": "user", "content": prompt}],
+        options=EVAL_OPTIONS,
+    )
+    raw = response["message"]["content"].strip()
+
+    cleaned = _FENCE_RE.sub("", raw).strip()
+
+    try:
+        result = loads(cleaned)
+        score = result.get("score", "partial")
+        feedback = result.get("feedback", raw)
+    except json.JSONDecodeError:
+        score = "partial"
+        for m in _VERDICT_RE.finditer(raw):
+            if m.group(1):
+                score = "incorrect"
+                break
+            score = "correct"
+        feedback = raw
+
+    if score not in ("correct", "partial", "incorrect"):
+        score = "partial"
+
+    return {"score": score, "feedback": feedback}
+
+
 @app.route("/api/quizzes/evaluate", methods=["POST"])
 def evaluate_answer():
     data = request.get_json(silent=True) or {}
@@ -390,70 +541,69 @@ def evaluate_answer():
     # Optional RAG context
     doc_block = ""
     try:
-        results = proc.query(question, n_results=2)
-        if results["documents"][0]:
-            doc_block = (
-                "\n\nRelevant documentation:\n"
-                + "\n".join(results["documents"][0][:2])
-            )
+        doc_block = _eval_doc_block(proc.query(question, n_results=2))
     except Exception:
         pass
 
-    prompt = (
-        f"You are grading a technical quiz answer.\n\n"
-        f"Question:\n{question}\n\n"
-        f"Model answer (reference):\n{model_answer}\n\n"
-        f"Student's answer:\n{user_answer}\n"
-        f"{doc_block}\n"
-        "Evaluate the student's answer. Consider:\n"
-        "1. Does it capture the key concepts from the model answer?\n"
-        "2. Is it technically accurate based on the documentation?\n"
-        "3. Are there any misconceptions or missing critical points?\n\n"
-        'Respond in EXACTLY this JSON format and nothing else:\n'
-        '{"score": "<correct|partial|incorrect>", "feedback": "<1-3 sentence explanation>"}'
-    )
-
-    llm_model = proc.models.get(mode, proc.models["qwen-7b"])
-
     try:
-        import ollama as _ollama
-        from backend.config import EVAL_OPTIONS
-        response = _ollama.chat(
-            model=llm_model,
-            messages=[{"role": "user", "content": prompt}],
-            options=EVAL_OPTIONS,
+        return jsonify(
+            _grade_answer(proc, question, user_answer, model_answer, mode, doc_block)
         )
-        raw = response["message"]["content"].strip()
+    except Exception as e:
+        logger.exception("Evaluation error")
+        return jsonify({"error": str(e)}), 500
 
-        cleaned = raw
-        if cleaned.startswith("```"):
-            cleaned = cleaned.split("\n", 1)[-1]
-        if cleaned.endswith("```"):
-            cleaned = cleaned.rsplit("```", 1)[0]
-        cleaned = cleaned.strip()
 
-        try:
-            result = json.loads(cleaned)
-            score = result.get("score", "partial")
-            feedback = result.get("feedback", raw)
-        except json.JSONDecodeError:
-            raw_lower = raw.lower()
-            if "correct" in raw_lower and "incorrect" not in raw_lower:
-                score = "correct"
-            elif "incorrect" in raw_lower:
-                score = "incorrect"
-            else:
-                score = "partial"
-            feedback = raw
+@app.route("/api/quizzes/evaluate_batch", methods=["POST"])
+def evaluate_batch():
+    """
+    Grade several short answers in one request.
 
-        if score not in ("correct", "partial", "incorrect"):
-            score = "partial"
+    Expects JSON body: { "items": [{question, user_answer, model_answer}, ...],
+    "mode": "qwen-7b" }. RAG context for all items is fetched in one batched
+    query, and grading calls run EVAL_CONCURRENCY at a time so Ollama can
+    overlap them. At most EVAL_MAX_BATCH items are accepted per request. Results come back in input order; an item whose grading
+    failed gets {"error": ...} instead of a score.
+    """
+    data = request.get_json(silent=True) or {}
+    items = data.get("items", [])
+    mode = data.get("mode", "qwen-7b")
 
-        return jsonify({"score": score, "feedback": feedback})
+    if not items or not isinstance(items, list):
+        return jsonify({"error": "items array is required"}), 400
+    if len(items) > EVAL_MAX_BATCH:
+        return jsonify({"error": f"at most {EVAL_MAX_BATCH} items per request"}), 400
+    for i, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get("question") or not item.get("user_answer"):
+            return jsonify({"error": f"item {i}: question and user_answer are required"}), 400
 
+    try:
+        proc = get_processor()
+    except OllamaConnectionError as e:
+        return jsonify({"error": str(e)}), 503
+
+    # Optional RAG context, one embed + one collection query for all items
+    doc_blocks = [""] * len(items)
+    try:
+        batch = proc.query_batch([item["question"] for item in items], n_results=2)
+        doc_blocks = [_eval_doc_block(results) for results in batch]
     except Exception as e:
-        logger.exception("Evaluation error")
-        return jsonify({"error": str(e)}), 500
+        logger.warning(f"Grading batch without RAG context: {e}")
+
+    def grade(item: dict, doc_block: str) -> dict:
+        try:
+            return _grade_answer(
+                proc, item["question"], item["user_answer"],
+                item.get("model_answer", ""), mode, doc_block,
+            )
+        except Exception as e:
+            logger.exception("Evaluation error")
+            return {"error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(EVAL_CONCURRENCY, len(items)))) as pool:
+        results = list(pool.map(grade, items, doc_blocks))
+
+    return jsonify({"results": results})
 
 
 @app.route("/api/quizzes/<quiz_id>/questions", methods=["DELETE"])
@@ -481,8 +631,7 @@ def delete_questions(quiz_id: str):
 
     for fp, _module in _iter_deck_files():
         try:
-            with open(fp) as f:
-                file_data = json.load(f)
+            file_data = read_json(fp)
             for qi, quiz in enumerate(file_data.get("quizzes", [])):
                 if quiz.get("id") == quiz_id:
                     target_path = fp
@@ -516,6 +665,7 @@ def delete_questions(quiz_id: str):
         with open(target_path, "w", encoding="utf-8") as f:
             json.dump(target_data, f, indent=2, ensure_ascii=False)
             f.write("\n")
+        _quiz_cache.pop(target_path, None)
     except Exception as e:
         return jsonify({"error": f"Failed to write file: {e}"}), 500
 
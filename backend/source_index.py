@@ -0,0 +1,135 @@
+"""
+Source index — per-file chunk counts kept beside the Chroma collection.
+
+get_stats() used to pull every chunk's metadata out of Chroma just to
+count chunks per source. Ingestion now keeps one row per indexed file
+(file_hash, source, doc_type, chunks) in a small SQLite table, so stats
+are one SELECT plus collection.count().
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (file_hash, source, doc_type, chunks)
+SourceRow = Tuple[str, str, str, int]
+
+
+class SourceIndex:
+    """
+    Thread-safe file_hash -> (source, doc_type, chunks) table.
+
+    Every update is a single SQLite transaction, applied right after the
+    matching Chroma write, so the table trails the collection by at most
+    one batch. A database indexed before the table existed is backfilled
+    once (see needs_backfill).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sources ("
+                "file_hash TEXT PRIMARY KEY, source TEXT NOT NULL, "
+                "doc_type TEXT NOT NULL, chunks INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+        self._lock = threading.Lock()
+
+    @property
+    def needs_backfill(self) -> bool:
+        """True until the table has been built from the collection once."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM meta WHERE key = 'backfilled'"
+                ).fetchone()
+        except sqlite3.Error as e:
+            # Don't fall into a full scan on every call over a broken file
+            logger.warning(f"Error reading source index: {e}")
+            return False
+        return row is None
+
+    def add(self, file_hash: str, source: str, doc_type: str, chunks: int) -> None:
+        """Count chunks just written to the collection for one file."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO sources (file_hash, source, doc_type, chunks) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(file_hash) DO UPDATE SET chunks = chunks + excluded.chunks",
+                    (file_hash, source, doc_type, chunks),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error updating source index: {e}")
+
+    def remove(self, file_hash: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM sources WHERE file_hash = ?", (file_hash,))
+        except sqlite3.Error as e:
+            logger.warning(f"Error updating source index: {e}")
+
+    def rows(self) -> List[SourceRow]:
+        """All rows in the order their files were indexed."""
+        try:
+            with self._lock:
+                return self._conn.execute(
+                    "SELECT file_hash, source, doc_type, chunks FROM sources ORDER BY rowid"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading source index: {e}")
+            return []
+
+    def replace_all(self, rows: Iterable[SourceRow]) -> None:
+        """Rebuild the table from scratch and mark it backfilled."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM sources")
+                self._conn.executemany(
+                    "INSERT INTO sources (file_hash, source, doc_type, chunks) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('backfilled', '1')"
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error rebuilding source index: {e}")
+
+
+def scan_collection(collection, page_size: int = 5000) -> List[SourceRow]:
+    """
+    Count chunks per file by paging through the collection's metadata.
+
+    Only used to backfill a database indexed before the source index
+    existed.
+    """
+    counts: Dict[str, List] = {}
+    offset = 0
+    while True:
+        page = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+        metadatas = page["metadatas"]
+        if not metadatas:
+            break
+        for meta in metadatas:
+            key = meta.get("file_hash", "")
+            entry = counts.get(key)
+            if entry is None:
+                counts[key] = [
+                    meta.get("source", "unknown"),
+                    meta.get("doc_type", "unknown"),
+                    1,
+                ]
+            else:
+                entry[2] += 1
+        offset += len(metadatas)
+    return [(h, src, doc_type, n) for h, (src, doc_type, n) in counts.items()]
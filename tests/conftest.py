@@ -0,0 +1,26 @@
+"""
+Shared pytest setup.
+
+Golden files under fixtures/ were generated by the code as it stood before
+the performance work, so these tests pin today's output to that baseline.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make `backend` importable when pytest is run from any directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture
+def fixtures() -> Path:
+    return FIXTURES
+
+
+def load_json(name: str):
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
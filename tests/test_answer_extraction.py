@@ -0,0 +1,68 @@
+"""extract_answer against the baseline parser's answers."""
+
+import pytest
+
+from backend.quiz_processor import extract_answer
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        # Pass 1: a parenthesized letter beats everything
+        ("(c) because", "c"),
+        ("**(b)**", "b"),
+        ("I think the correct answer is (d)", "d"),
+        # Pass 2 ("answer is x") beats bold and line markers wherever it sits
+        ("The answer is b. Also **c**", "b"),
+        ("answer is b, not **a**", "b"),
+        ("a\nthe answer is d", "d"),
+        ("Answer is a", "a"),
+        ("THE ANSWER IS C", "c"),
+        # Pass 3 (bold) beats pass 4 (line start), even when it comes later
+        ("**c** is right\na. no", "c"),
+        ("b: yes\n**a**", "a"),
+        # Pass 4: earliest letter at the start of a line
+        ("a. first\nb. second", "a"),
+        ("Consider this.\n c) maybe", "c"),
+        # Pass 5: first letter a-d anywhere
+        ("Option D seems best", "d"),
+        ("Both b and c", "b"),
+        ("xyz", "?"),
+        ("", "?"),
+    ],
+)
+def test_extract_mc(response, expected):
+    assert extract_answer(response, "mc") == expected
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ("True. Because", "T"),
+        ("  **False** because", "F"),
+        ("> - true", "T"),
+        ("　True", "T"),
+        ("false", "F"),
+        ("The statement is false.", "F"),
+        ("It is true that x\nbut false that y", "T"),
+        ("true and false", "T"),
+        ("Well:\n**True**", "T"),
+        ("Hmm\nFinal: false", "F"),
+        ("Long story\nso the answer is true", "T"),
+        ("neither", "?"),
+    ],
+)
+def test_extract_tf(response, expected):
+    assert extract_answer(response, "tf") == expected
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ("  padded answer \n", "padded answer"),
+        ("plain", "plain"),
+        ("", "?"),
+    ],
+)
+def test_extract_sa_is_stripped(response, expected):
+    assert extract_answer(response, "sa") == expected
@@ -0,0 +1,56 @@
+"""Markdown sectioning and chunking against baseline golden output."""
+
+import pytest
+
+from backend.document_processor import (
+    MarkdownSection,
+    chunk_markdown_file,
+    chunk_section,
+)
+
+from conftest import load_json
+
+CASES = {
+    "default": {},
+    "small": {"max_size": 300, "overlap": 60},
+    "top_level": {"max_size": 300, "overlap": 60, "top_level_only": True},
+}
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_chunk_markdown_file_matches_golden(fixtures, case):
+    content = (fixtures / "sample_doc.md").read_text(encoding="utf-8")
+    chunks = chunk_markdown_file(content, "sample_doc.md", "abc123", **CASES[case])
+    got = [{"text": c.text, "metadata": c.metadata} for c in chunks]
+    assert got == load_json("chunks_expected.json")[case]
+
+
+def _section(body: str, heading: str = "## H") -> MarkdownSection:
+    return MarkdownSection(
+        heading=heading,
+        heading_text=heading.lstrip("# "),
+        heading_level=2,
+        body=body,
+        breadcrumb=["H"],
+    )
+
+
+def test_chunk_section_single_chunk_fast_path():
+    body = "First para.  \n\n\n\n  Second para.\n\n   \n\nThird."
+    assert chunk_section(_section(body), max_size=500, overlap=50) == [
+        "## H\n\nFirst para.\n\nSecond para.\n\nThird."
+    ]
+
+
+def test_chunk_section_empty_body():
+    assert chunk_section(_section("  \n\n "), max_size=100, overlap=10) == []
+
+
+def test_chunk_section_overlap_stays_in_section():
+    body = "\n\n".join(["alpha " * 10, "beta " * 10, "gamma " * 10])
+    chunks = chunk_section(_section(body, heading=""), max_size=70, overlap=20)
+    assert chunks == [
+        "alpha alpha alpha alpha alpha alpha alpha alpha alpha alpha",
+        "[...] alpha alpha alpha\n\nbeta beta beta beta beta beta beta beta beta beta",
+        "[...] beta beta beta beta\n\ngamma gamma gamma gamma gamma gamma gamma gamma gamma gamma",
+    ]
@@ -0,0 +1,51 @@
+"""Markdown and JSON quiz parsing against baseline golden output."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from backend.quiz_processor import (
+    QuizParser,
+    _load_questions,
+    parse_json_quiz,
+)
+
+from conftest import load_json
+
+
+def test_markdown_quiz_matches_golden(fixtures):
+    questions, answer_key = QuizParser().parse(
+        (fixtures / "quiz.md").read_text(encoding="utf-8")
+    )
+    expected = load_json("quiz_md_expected.json")
+    assert [asdict(q) for q in questions] == expected["questions"]
+    assert [asdict(e) for e in answer_key] == expected["answer_key"]
+
+
+def test_json_quiz_matches_golden(fixtures):
+    data = json.loads((fixtures / "quiz.json").read_text(encoding="utf-8"))
+    questions, answer_key, meta = parse_json_quiz(data)
+    expected = load_json("quiz_json_expected.json")
+    assert [asdict(q) for q in questions] == expected["questions"]
+    assert {k: asdict(v) for k, v in answer_key.items()} == expected["answer_key"]
+    assert meta == expected["metadata"]
+
+
+def test_json_quiz_unknown_id(fixtures):
+    data = json.loads((fixtures / "quiz.json").read_text(encoding="utf-8"))
+    with pytest.raises(ValueError, match="not found"):
+        parse_json_quiz(data, quiz_id="missing")
+
+
+def test_load_questions_returns_fresh_copies(fixtures):
+    path = str(fixtures / "quiz.json")
+    questions, answer_key, _ = _load_questions(path)
+    questions[2].choices.append("(z) extra")
+    questions[2].text = "changed"
+    answer_key["MC-1"].answer = "z"
+
+    again, again_key, _ = _load_questions(path)
+    assert "(z) extra" not in again[2].choices
+    assert again[2].text != "changed"
+    assert again_key["MC-1"].answer == "b"
@@ -0,0 +1,107 @@
+"""Quiz result and benchmark report writers against baseline golden output."""
+
+import json
+
+import pytest
+
+from backend.quiz_processor import (
+    BenchmarkResult,
+    QuizBenchmarkSummary,
+    _score_summary,
+    _timing_note,
+    _write_benchmark_report,
+    _write_multi_benchmark_report,
+    grade_question,
+    parse_json_quiz,
+    write_results,
+)
+
+RESPONSES = {
+    "a": {
+        "TF-1": "False. NULL comparisons are unknown.",
+        "TF-2": "True",
+        "MC-1": "(b) Projection",
+        "MC-2": "The answer is c",
+        "SA-1": "Foreign keys must match.",
+    },
+    "b": {
+        "TF-1": "True, obviously.",
+        "TF-2": "**True**",
+        "MC-1": "a. Selection",
+        "MC-2": "**b**",
+        "SA-1": "No idea",
+    },
+}
+
+
+@pytest.fixture
+def quiz(fixtures):
+    data = json.loads((fixtures / "quiz.json").read_text(encoding="utf-8"))
+    return parse_json_quiz(data)
+
+
+def _graded(quiz, config):
+    questions, answer_key, _ = quiz
+    return [grade_question(q, RESPONSES[config][q.id], answer_key) for q in questions]
+
+
+def _result(label, mode, use_rag, graded, elapsed):
+    total, correct, incorrect, ungraded, accuracy = _score_summary(graded)
+    return BenchmarkResult(
+        label=label, mode=mode, use_rag=use_rag, grounded=True,
+        total=total, correct=correct, incorrect=incorrect, ungraded=ungraded,
+        accuracy=accuracy, elapsed=elapsed, graded=graded,
+    )
+
+
+@pytest.fixture
+def results(quiz):
+    rag = _result("qwen-7b / rag", "qwen-7b", True, _graded(quiz, "a"), 12.5)
+    no_rag = _result("llama3-3b / no-rag", "llama3-3b", False, _graded(quiz, "b"), 7.25)
+    return rag, no_rag
+
+
+def test_write_results_matches_golden(tmp_path, fixtures, quiz):
+    metadata = {
+        "title": quiz[2]["title"], "mode": "qwen-7b", "use_rag": True,
+        "grounded": True, "sections": "mc,tf", "limit": 5,
+    }
+    out = write_results(_graded(quiz, "a"), str(tmp_path / "r.md"), metadata)
+    expected = (fixtures / "results_expected.md").read_text(encoding="utf-8")
+    assert (tmp_path / "r.md").read_text(encoding="utf-8") == expected
+    assert out == str(tmp_path / "r.md")
+
+    sidecar = json.loads((tmp_path / "r.json").read_text(encoding="utf-8"))
+    assert sidecar["summary"]["correct"] == 3
+    assert sidecar["metadata"] == metadata
+
+
+def test_benchmark_report_matches_golden(tmp_path, fixtures, quiz, results):
+    rag, no_rag = results
+    _write_benchmark_report([no_rag, rag], str(tmp_path / "b.md"), quiz[2]["title"], {})
+    expected = (fixtures / "benchmark_expected.md").read_text(encoding="utf-8")
+    assert (tmp_path / "b.md").read_text(encoding="utf-8") == expected
+
+
+def test_multi_benchmark_report_matches_golden(tmp_path, fixtures, quiz, results):
+    rag, no_rag = results
+    summaries = [
+        QuizBenchmarkSummary(quiz_title=quiz[2]["title"], quiz_path="quiz.json",
+                             results=[rag, no_rag]),
+        QuizBenchmarkSummary(quiz_title="Week 4: SQL Queries and Subqueries",
+                             quiz_path="q2.json", results=[no_rag, rag]),
+    ]
+    _write_multi_benchmark_report(summaries, str(tmp_path / "m.md"))
+    expected = (fixtures / "multi_benchmark_expected.md").read_text(encoding="utf-8")
+    assert (tmp_path / "m.md").read_text(encoding="utf-8") == expected
+
+
+def test_timing_note_only_for_concurrent_runs(tmp_path, quiz, results):
+    assert _timing_note(1, 1) == ""
+    note = _timing_note(4, 2)
+    assert "4 question(s) in flight" in note and "2 config(s)" in note
+
+    rag, no_rag = results
+    _write_benchmark_report([rag, no_rag], str(tmp_path / "b.md"), "T", {}, timing_note=note)
+    report = (tmp_path / "b.md").read_text(encoding="utf-8")
+    assert report.startswith("# Benchmark Report\n\n**Quiz:** T\n\n" + note + "## Summary")
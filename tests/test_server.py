@@ -0,0 +1,134 @@
+"""Flask API routes in backend.server."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from backend import server
+
+
+class _FakeProcessor:
+    def __init__(self, tokens, error=None):
+        self.tokens = tokens
+        self.error = error
+
+    def ask_question(self, question, **kwargs):
+        yield from self.tokens
+        if self.error is not None:
+            raise self.error
+
+
+def _events(monkeypatch, processor):
+    monkeypatch.setattr(server, "_processor", processor)
+    client = server.app.test_client()
+    resp = client.post("/api/chat", json={"question": "What is JSX?"})
+    assert resp.mimetype == "text/event-stream"
+    body = resp.get_data(as_text=True)
+    assert body.endswith("\n\n")
+    return [chunk[len("data: "):] for chunk in body.split("\n\n")[:-1]]
+
+
+def test_tokens_are_batched(monkeypatch):
+    # A huge time window leaves only the count threshold in play
+    monkeypatch.setattr(server, "_SSE_BATCH_SECONDS", 3600)
+    tokens = list("abcdefghij")
+    events = _events(monkeypatch, _FakeProcessor(tokens))
+
+    assert events[-1] == "[DONE]"
+    batches = [json.loads(e)["token"] for e in events[:-1]]
+    assert batches == ["abcd", "efgh", "ij"]
+
+
+def test_slow_tokens_are_sent_one_by_one(monkeypatch):
+    monkeypatch.setattr(server, "_SSE_BATCH_SECONDS", -1)
+    events = _events(monkeypatch, _FakeProcessor(["Hel", "lo", " world"]))
+    assert [json.loads(e)["token"] for e in events[:-1]] == ["Hel", "lo", " world"]
+    assert events[-1] == "[DONE]"
+
+
+def test_error_mid_stream_is_reported(monkeypatch):
+    events = _events(
+        monkeypatch, _FakeProcessor(["a", "b"], error=RuntimeError("boom"))
+    )
+    assert json.loads(events[-1]) == {"error": "boom"}
+    assert "[DONE]" not in events
+
+
+@pytest.mark.parametrize("payload", [{}, {"question": "   "}])
+def test_question_required(payload):
+    resp = server.app.test_client().post("/api/chat", json=payload)
+    assert resp.status_code == 400
+
+
+def _write_deck(path, *quiz_ids, mtime_ns):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    quizzes = [{"id": qid, "title": f"{qid} from {path.name}", "sections": []}
+               for qid in quiz_ids]
+    path.write_text(json.dumps({"quizzes": quizzes}), encoding="utf-8")
+    # Explicit mtimes: back-to-back writes can share a coarse timestamp
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def decks(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "DECK_DIR", tmp_path)
+    monkeypatch.setattr(server, "_quiz_cache", {})
+    monkeypatch.setattr(server, "_quiz_index", ((), {}))
+    return tmp_path
+
+
+def _get_quiz(quiz_id):
+    return server.app.test_client().get(f"/api/quizzes/{quiz_id}")
+
+
+def test_quiz_added_in_place_is_found(decks):
+    deck = decks / "mod" / "x.json"
+    _write_deck(deck, "a", mtime_ns=1_000_000_000)
+    assert _get_quiz("b").status_code == 404
+
+    _write_deck(deck, "a", "b", mtime_ns=2_000_000_000)
+    assert _get_quiz("b").status_code == 200
+
+
+def test_first_deck_file_wins(decks):
+    _write_deck(decks / "mod" / "y.json", "a", mtime_ns=1_000_000_000)
+    assert _get_quiz("a").get_json()["title"] == "a from y.json"
+
+    _write_deck(decks / "mod" / "x.json", "a", mtime_ns=2_000_000_000)
+    assert _get_quiz("a").get_json()["title"] == "a from x.json"
+
+
+class _NoRagProcessor:
+    def query_batch(self, questions, n_results):
+        raise RuntimeError("collection unavailable")
+
+
+def test_evaluate_batch_overlaps_grading(monkeypatch, caplog):
+    monkeypatch.setattr(server, "_processor", _NoRagProcessor())
+    monkeypatch.setattr(server, "EVAL_CONCURRENCY", 2)
+    both_running = threading.Barrier(2, timeout=5)
+
+    def grade(proc, question, user_answer, model_answer, mode, doc_block):
+        both_running.wait()  # Times out unless two items are graded at once
+        return {"score": 1, "question": question, "context": doc_block}
+
+    monkeypatch.setattr(server, "_grade_answer", grade)
+    items = [{"question": f"Q{i}", "user_answer": "A"} for i in range(2)]
+    resp = server.app.test_client().post(
+        "/api/quizzes/evaluate_batch", json={"items": items}
+    )
+    assert resp.status_code == 200
+    assert [r["question"] for r in resp.get_json()["results"]] == ["Q0", "Q1"]
+    assert [r["context"] for r in resp.get_json()["results"]] == ["", ""]
+    assert "without RAG context" in caplog.text
+
+
+def test_evaluate_batch_size_is_capped(monkeypatch):
+    monkeypatch.setattr(server, "EVAL_MAX_BATCH", 2)
+    items = [{"question": "Q", "user_answer": "A"}] * 3
+    resp = server.app.test_client().post(
+        "/api/quizzes/evaluate_batch", json={"items": items}
+    )
+    assert resp.status_code == 400